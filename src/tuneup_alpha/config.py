@@ -2,19 +2,40 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from .logging_config import AuditLogger, get_logger
-from .models import AppConfig, Record, Zone
+from .models import AppConfig, LoggingConfig, Record, Zone
 
 logger = get_logger(__name__)
 audit_logger = AuditLogger()
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+
+def _schema_version(model: type[BaseModel]) -> str:
+    """Fingerprint a model's JSON schema, including every nested model."""
+
+    schema = json.dumps(model.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()
+
+
+# Snapshots are rebuilt without validation, so one written for another schema
+# must be ignored; the version follows the models' schema automatically.
+_SNAPSHOT_VERSION = _schema_version(AppConfig)
+
 
 class ConfigError(RuntimeError):
     """Raised when the configuration file cannot be parsed or updated."""
@@ -30,21 +51,34 @@ def default_config_path() -> Path:
 class ConfigRepository:
     """Handles reading and writing the TuneUp Alpha configuration file."""
 
-    def __init__(self, path: Path | None = None) -> None:
-        self.path = path if path else default_config_path()
-        self.path = Path(self.path)
+    def __init__(self, path: Path | str | None = None) -> None:
+        if not path:
+            path = default_config_path()
+        self.path = path if isinstance(path, Path) else Path(path)
+        self.cache_path = self.path.with_name(f"{self.path.name}.cache.json")
 
     def load(self) -> AppConfig:
         """Parse configuration from disk or return an empty config."""
 
         logger.debug(f"Loading configuration from {self.path}")
 
-        if not self.path.exists():
+        try:
+            text = self.path.read_text()
+        except FileNotFoundError:
             logger.info(f"Configuration file not found at {self.path}, returning empty config")
             return AppConfig()
 
+        cached = self._load_cached(text)
+        if cached is not None:
+            return cached
+
+        return self._parse(text)
+
+    def _parse(self, text: str) -> AppConfig:
+        """Validate YAML text read from the configuration path."""
+
         try:
-            payload: Any = yaml.safe_load(self.path.read_text()) or {}
+            payload: Any = yaml.safe_load(text) or {}
         except yaml.YAMLError as exc:  # pragma: no cover - yaml error path
             logger.error(f"Failed to parse YAML at {self.path}: {exc}")
             raise ConfigError(f"Failed to parse YAML at {self.path}") from exc
@@ -57,14 +91,89 @@ class ConfigRepository:
             logger.error(f"Invalid configuration detected: {exc}")
             raise ConfigError(f"Invalid configuration detected: {exc}") from exc
 
+    def _load_cached(self, text: str) -> AppConfig | None:
+        """Return the config from the JSON snapshot if it was written for ``text``.
+
+        The snapshot is written next to the YAML file on every save together
+        with a digest of that YAML. Parsing JSON is far cheaper than parsing
+        YAML, but any other YAML content (hand-edited, or restored from a
+        backup with an older modification time) no longer matches the digest
+        and is parsed instead. The snapshot was produced from an already
+        validated config, so models are rebuilt with ``model_construct``
+        instead of being validated again.
+        """
+
+        if not self.cache_path.exists():
+            return None
+
+        try:
+            snapshot = json.loads(self.cache_path.read_bytes())
+            if snapshot.get("version") != _SNAPSHOT_VERSION:
+                logger.debug(f"Configuration cache at {self.cache_path} has another version")
+                return None
+            if snapshot.get("source") != _source_digest(text):
+                logger.debug(f"Configuration cache at {self.cache_path} is stale")
+                return None
+            config = _construct_trusted(snapshot["config"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+            logger.debug(f"Ignoring unreadable configuration cache {self.cache_path}: {exc}")
+            return None
+
+        logger.info(f"Loaded configuration with {len(config.zones)} zone(s) from cache")
+        return config
+
     def save(self, config: AppConfig) -> None:
         """Write configuration data to disk."""
 
         logger.debug(f"Saving configuration to {self.path}")
+        self._write(*_serialize(config))
+        logger.info(f"Configuration saved to {self.path}")
+
+    def _write(self, yaml_str: str, json_str: str) -> None:
+        """Write already-serialized YAML and its JSON snapshot to disk."""
+
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        data = config.model_dump(mode="json")
-        yaml_str = yaml.safe_dump(data, sort_keys=False)
         self.path.write_text(yaml_str)
+        self._write_cache(json_str)
+
+    def _write_cache(self, json_str: str) -> None:
+        """Write the JSON snapshot; failures only cost the fast path."""
+
+        try:
+            self.cache_path.write_text(json_str)
+        except OSError as exc:
+            logger.debug(f"Could not write configuration cache {self.cache_path}: {exc}")
+
+    @contextmanager
+    def _modify(self) -> Iterator[AppConfig]:
+        """Load, lock and rewrite the configuration around a mutation.
+
+        The file is opened once and held under an exclusive advisory lock, so
+        the read and the write share one descriptor and concurrent writers
+        cannot interleave. If the mutation raises, nothing is written.
+        """
+
+        logger.debug(f"Opening configuration for update at {self.path}")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        created = not self.path.exists()
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        with open(fd, "r+") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                config = self._parse(handle.read())
+                yield config
+            except BaseException:
+                if created:
+                    self.path.unlink(missing_ok=True)
+                raise
+            yaml_str, json_str = _serialize(config)
+            handle.seek(0)
+            handle.truncate()
+            handle.write(yaml_str)
+            handle.flush()
+            # Written under the lock so the snapshot never trails another writer
+            self._write_cache(json_str)
         logger.info(f"Configuration saved to {self.path}")
 
     def ensure_sample(self, overwrite: bool = False) -> Path:
@@ -73,34 +182,33 @@ class ConfigRepository:
         if self.path.exists() and not overwrite:
             return self.path
 
-        sample = sample_config()
-        self.save(sample)
+        logger.debug(f"Writing sample configuration to {self.path}")
+        self._write(_SAMPLE_YAML, _SAMPLE_JSON)
         return self.path
 
     def add_zone(self, zone: Zone, overwrite: bool = False) -> AppConfig:
         """Persist a new zone, optionally overwriting existing entries."""
 
         logger.debug(f"Adding zone: {zone.name}")
-        config = self.load()
-        existing_index = next(
-            (index for index, existing in enumerate(config.zones) if existing.name == zone.name),
-            None,
-        )
-
-        if existing_index is not None and not overwrite:
-            logger.warning(f"Zone '{zone.name}' already exists")
-            raise ConfigError(
-                f"Zone '{zone.name}' already exists. Use overwrite=True to replace it."
+        with self._modify() as config:
+            existing_index = next(
+                (i for i, existing in enumerate(config.zones) if existing.name == zone.name),
+                None,
             )
 
-        if existing_index is None:
-            config.zones.append(zone)
-            action = "created"
-        else:
-            config.zones[existing_index] = zone
-            action = "updated"
+            if existing_index is not None and not overwrite:
+                logger.warning(f"Zone '{zone.name}' already exists")
+                raise ConfigError(
+                    f"Zone '{zone.name}' already exists. Use overwrite=True to replace it."
+                )
+
+            if existing_index is None:
+                config.zones.append(zone)
+                action = "created"
+            else:
+                config.zones[existing_index] = zone
+                action = "updated"
 
-        self.save(config)
         audit_logger.log_zone_change(
             action=action,
             zone_name=zone.name,
@@ -116,13 +224,12 @@ class ConfigRepository:
         """Remove a zone by name and persist the updated configuration."""
 
         logger.debug(f"Deleting zone: {name}")
-        config = self.load()
-        index = next((i for i, zone in enumerate(config.zones) if zone.name == name), None)
-        if index is None:
-            logger.warning(f"Zone '{name}' not found for deletion")
-            raise ConfigError(f"Zone '{name}' was not found.")
-        del config.zones[index]
-        self.save(config)
+        with self._modify() as config:
+            index = next((i for i, zone in enumerate(config.zones) if zone.name == name), None)
+            if index is None:
+                logger.warning(f"Zone '{name}' not found for deletion")
+                raise ConfigError(f"Zone '{name}' was not found.")
+            del config.zones[index]
         audit_logger.log_zone_change(action="deleted", zone_name=name)
         logger.info(f"Zone '{name}' deleted")
         return config
@@ -131,25 +238,24 @@ class ConfigRepository:
         """Update an existing zone, optionally renaming it, and persist to disk."""
 
         logger.debug(f"Updating zone: {original_name}")
-        config = self.load()
-        current_index = next(
-            (i for i, zone in enumerate(config.zones) if zone.name == original_name),
-            None,
-        )
-        if current_index is None:
-            logger.warning(f"Zone '{original_name}' not found for update")
-            raise ConfigError(f"Zone '{original_name}' was not found.")
+        with self._modify() as config:
+            current_index = next(
+                (i for i, zone in enumerate(config.zones) if zone.name == original_name),
+                None,
+            )
+            if current_index is None:
+                logger.warning(f"Zone '{original_name}' not found for update")
+                raise ConfigError(f"Zone '{original_name}' was not found.")
 
-        conflict_index = next(
-            (i for i, zone in enumerate(config.zones) if zone.name == updated.name),
-            None,
-        )
-        if conflict_index is not None and conflict_index != current_index:
-            logger.warning(f"Zone name conflict: '{updated.name}' already exists")
-            raise ConfigError(f"Zone '{updated.name}' already exists. Choose a different name.")
+            conflict_index = next(
+                (i for i, zone in enumerate(config.zones) if zone.name == updated.name),
+                None,
+            )
+            if conflict_index is not None and conflict_index != current_index:
+                logger.warning(f"Zone name conflict: '{updated.name}' already exists")
+                raise ConfigError(f"Zone '{updated.name}' already exists. Choose a different name.")
 
-        config.zones[current_index] = updated
-        self.save(config)
+            config.zones[current_index] = updated
         audit_logger.log_zone_change(
             action="updated",
             zone_name=updated.name,
@@ -163,8 +269,44 @@ class ConfigRepository:
         return config
 
 
-def sample_config() -> AppConfig:
-    """Return an AppConfig populated with a default example."""
+def _serialize(config: AppConfig) -> tuple[str, str]:
+    """Serialize a configuration to its on-disk YAML and JSON snapshot forms."""
+
+    data = config.model_dump(mode="json")
+    yaml_str = yaml.safe_dump(data, sort_keys=False)
+    snapshot = {"version": _SNAPSHOT_VERSION, "source": _source_digest(yaml_str), "config": data}
+    return yaml_str, json.dumps(snapshot, separators=(",", ":"))
+
+
+def _source_digest(yaml_str: str) -> str:
+    """Fingerprint the YAML text a snapshot was serialized alongside."""
+
+    return hashlib.sha256(yaml_str.encode("utf-8")).hexdigest()
+
+
+def _construct_trusted(data: dict[str, Any]) -> AppConfig:
+    """Rebuild a snapshot written by ``_serialize`` without re-running validation."""
+
+    zones = [
+        Zone.model_construct(
+            **{
+                **zone,
+                "key_file": Path(zone["key_file"]),
+                "records": [Record.model_construct(**record) for record in zone["records"]],
+            }
+        )
+        for zone in data["zones"]
+    ]
+    logging_data = data["logging"]
+    log_file = logging_data["log_file"]
+    logging = LoggingConfig.model_construct(
+        **{**logging_data, "log_file": Path(log_file) if log_file is not None else None}
+    )
+    return AppConfig.model_construct(**{**data, "zones": zones, "logging": logging})
+
+
+def _build_sample_config() -> AppConfig:
+    """Construct the default example configuration."""
 
     return AppConfig(
         zones=[
@@ -199,6 +341,16 @@ def sample_config() -> AppConfig:
     )
 
 
+_SAMPLE_CONFIG = _build_sample_config()
+_SAMPLE_YAML, _SAMPLE_JSON = _serialize(_SAMPLE_CONFIG)
+
+
+def sample_config() -> AppConfig:
+    """Return an AppConfig populated with a default example."""
+
+    return _SAMPLE_CONFIG.model_copy(deep=True)
+
+
 def load_config(path: Path | None = None) -> AppConfig:
     """Helper to read configuration using a single call."""
 
@@ -2,18 +2,33 @@
 
 from __future__ import annotations
 
-import re
+import ipaddress
 import socket
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 
 from .logging_config import get_logger
+from .models import HOSTNAME_RE
 
 logger = get_logger(__name__)
 
 LookupResult = dict[str, str | None]
 DigResult = dict[str, list[str]]
 
+# Resolver budget shared by every dig query: two tries of two seconds each,
+# which ends well inside the hard subprocess timeout, so an unresponsive
+# server gives a clean empty answer instead of a killed process
+_DIG_QUERY_OPTIONS = ("+time=2", "+tries=2")
+_DIG_TIMEOUT_SECONDS = 5
+
+# Documentation ranges (TEST-NET-1/2/3); like loopback, link-local, multicast
+# and reserved space they have no PTR records worth waiting for
+_NO_REVERSE_NETWORKS = tuple(
+    ipaddress.IPv4Network(network)
+    for network in ("192.0.2.0/24", "198.51.100.0/24", "203.0.113.0/24")
+)
+
 
 def is_ipv4(value: str) -> bool:
     """Check if a string is a valid IPv4 address.
@@ -24,12 +39,17 @@ def is_ipv4(value: str) -> bool:
     Returns:
         True if the string is a valid IPv4 address
     """
-    ipv4_pattern = r"^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$"
-    match = re.match(ipv4_pattern, value)
-    if not match:
+    # Hostnames are the common input here; reject anything that is not
+    # digits and dots before paying for the libc call.
+    if not value.replace(".", "").isdigit():
+        return False
+    # inet_pton only accepts the strict dotted-quad form, unlike inet_aton
+    # which also takes shortened, hex and trailing-garbage variants.
+    try:
+        socket.inet_pton(socket.AF_INET, value)
+    except (OSError, ValueError):
         return False
-    # Check each octet is 0-255
-    return all(int(octet) <= 255 for octet in match.groups())
+    return True
 
 
 def is_ipv6(value: str) -> bool:
@@ -41,9 +61,44 @@ def is_ipv6(value: str) -> bool:
     Returns:
         True if the string is a valid IPv6 address
     """
-    # Basic IPv6 validation - accepts full and compressed forms
-    ipv6_pattern = r"^(([0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,7}:|([0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,5}(:[0-9a-fA-F]{1,4}){1,2}|([0-9a-fA-F]{1,4}:){1,4}(:[0-9a-fA-F]{1,4}){1,3}|([0-9a-fA-F]{1,4}:){1,3}(:[0-9a-fA-F]{1,4}){1,4}|([0-9a-fA-F]{1,4}:){1,2}(:[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:((:[0-9a-fA-F]{1,4}){1,6})|:((:[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(:[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|::(ffff(:0{1,4}){0,1}:){0,1}((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])|([0-9a-fA-F]{1,4}:){1,4}:((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9]))$"
-    return bool(re.match(ipv6_pattern, value))
+    # Hostnames never contain a colon, so most values skip the parser
+    if ":" not in value:
+        return False
+    try:
+        ipaddress.IPv6Address(value)
+    except ValueError:
+        return False
+    return True
+
+
+def is_hostname(value: str) -> bool:
+    """Check if a string is a syntactically valid host name.
+
+    Args:
+        value: String to check
+
+    Returns:
+        True if the string could be resolved as a host name
+    """
+    return HOSTNAME_RE.match(value) is not None
+
+
+def _has_reverse_dns(ip_address: str) -> bool:
+    """Tell whether an IPv4 address can have a meaningful PTR record.
+
+    Private (RFC 1918) addresses still qualify, since internal resolvers
+    commonly serve reverse zones for them.
+    """
+    address = ipaddress.IPv4Address(ip_address)
+    if (
+        address.is_loopback
+        or address.is_link_local
+        or address.is_multicast
+        or address.is_reserved
+        or address.is_unspecified
+    ):
+        return False
+    return not any(address in network for network in _NO_REVERSE_NETWORKS)
 
 
 def reverse_dns_lookup(ip_address: str) -> LookupResult:
@@ -102,10 +157,10 @@ def dig_lookup(domain: str, record_type: str) -> list[str]:
     try:
         # Run dig command with short output
         result = subprocess.run(
-            ["dig", "+short", domain, record_type],
+            ["dig", "+short", *_DIG_QUERY_OPTIONS, domain, record_type],
             capture_output=True,
             text=True,
-            timeout=5,
+            timeout=_DIG_TIMEOUT_SECONDS,
             check=False,
         )
 
@@ -113,13 +168,8 @@ def dig_lookup(domain: str, record_type: str) -> list[str]:
             logger.debug(f"dig command failed for {domain} {record_type}")
             return []
 
-        # Parse output - each line is a result
-        values = []
-        for line in result.stdout.strip().split("\n"):
-            line = line.strip()
-            if line:
-                # Remove trailing dot from hostnames
-                values.append(line.rstrip("."))
+        # Parse output - each non-empty line is a result; drop trailing dots
+        values = [line.rstrip(".") for raw in result.stdout.split("\n") if (line := raw.strip())]
 
         logger.debug(f"dig lookup found {len(values)} record(s) for {domain} {record_type}")
         return values
@@ -242,18 +292,23 @@ def dns_lookup_label(
     # Construct FQDN from label and zone
     fqdn = zone_name if label == "@" else f"{label}.{zone_name}"
 
-    # First try CNAME lookup
-    cnames = lookup_cname_records(fqdn)
+    # The three queries are independent, so run them together and wait for the
+    # slowest one instead of the sum of all three
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        cname_future = executor.submit(lookup_cname_records, fqdn)
+        a_future = executor.submit(lookup_a_records, fqdn)
+        aaaa_future = executor.submit(lookup_aaaa_records, fqdn)
+
+    # Prefer CNAME, then A, then AAAA
+    cnames = cname_future.result()
     if cnames:
         return "CNAME", cnames[0]
 
-    # Then try A record lookup
-    a_records = lookup_a_records(fqdn)
+    a_records = a_future.result()
     if a_records:
         return "A", a_records[0]
 
-    # Try AAAA record lookup
-    aaaa_records = lookup_aaaa_records(fqdn)
+    aaaa_records = aaaa_future.result()
     if aaaa_records:
         return "AAAA", aaaa_records[0]
 
@@ -321,6 +376,9 @@ def dns_lookup(value: str) -> tuple[Literal["A", "AAAA", "CNAME"] | None, Lookup
     # Check if it's an IPv4 address
     if is_ipv4(value):
         # For IPv4 addresses, suggest A record and try reverse DNS
+        if not _has_reverse_dns(value):
+            logger.debug(f"Skipping reverse DNS lookup for non-routable IP: {value}")
+            return "A", {"hostname": None}
         result = reverse_dns_lookup(value)
         return "A", result
     elif is_ipv6(value):
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Literal
 
 from .dns_lookup import dig_lookup
@@ -13,6 +15,15 @@ logger = get_logger(__name__)
 
 ChangeType = Literal["create", "delete", "update", "no-change"]
 
+# (label, type, value, priority, weight, port) identity used to diff records
+RecordKey = tuple[str, str, str, int | None, int | None, int | None]
+
+# Record types probed for every label when reading the live zone
+_QUERY_RECORD_TYPES = ("A", "AAAA", "CNAME", "MX", "TXT", "SRV", "NS", "CAA")
+
+# Upper bound on concurrent dig processes spawned for one zone
+_MAX_QUERY_WORKERS = 16
+
 
 @dataclass
 class DNSRecordState:
@@ -48,92 +59,141 @@ class DNSStateDiff:
         return summary
 
 
-def query_current_dns_state(zone: Zone) -> list[DNSRecordState]:
+@dataclass
+class DigCache:
+    """Memoizes dig lookups by (domain, record type) for one comparison run.
+
+    Pass the same instance to several state queries to avoid re-issuing
+    identical DNS queries; create a fresh one whenever live data must be
+    re-read. Safe to share across the query thread pool.
+    """
+
+    results: dict[tuple[str, str], list[str]] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def get_or_fetch(self, domain: str, record_type: str) -> list[str]:
+        """Return cached results for a query, running dig on the first request."""
+        key = (domain, record_type)
+        with self._lock:
+            cached = self.results.get(key)
+        if cached is not None:
+            return cached
+
+        values = dig_lookup(domain, record_type)
+        with self._lock:
+            return self.results.setdefault(key, values)
+
+
+def query_current_dns_state(zone: Zone, cache: DigCache | None = None) -> list[DNSRecordState]:
     """Query the current DNS state for all records in a zone.
 
+    Every (label, record type) probe is independent and bound by network
+    round-trip time, so the probes run concurrently on a thread pool and the
+    wall time approaches the slowest single query rather than their sum.
+
     Args:
         zone: The zone to query
+        cache: Optional lookup cache shared with other queries in the same run
 
     Returns:
         List of DNSRecordState objects representing current DNS records
     """
     logger.info(f"Querying current DNS state for zone: {zone.name}")
-    current_records: list[DNSRecordState] = []
+    if cache is None:
+        cache = DigCache()
 
     # Get all unique labels from desired records to query
-    labels_to_query = set()
-    for record in zone.records:
-        labels_to_query.add(record.label)
+    labels_to_query = {record.label for record in zone.records}
 
     # Also query the apex
     labels_to_query.add("@")
 
     # For each label, query all relevant record types
-    record_types = ["A", "AAAA", "CNAME", "MX", "TXT", "SRV", "NS", "CAA"]
-
-    for label in labels_to_query:
-        fqdn = zone.name if label == "@" else f"{label}.{zone.name}"
-
-        for record_type in record_types:
-            try:
-                results = dig_lookup(fqdn, record_type)
-                if results:
-                    logger.debug(f"Found {len(results)} {record_type} record(s) for {fqdn}")
-                    for value in results:
-                        # Parse the result based on record type
-                        current_records.append(_parse_dns_record(label, record_type, value))
-            except Exception as e:
-                logger.warning(f"Failed to query {record_type} records for {fqdn}: {e}")
+    probes = [
+        (label, zone.name if label == "@" else f"{label}.{zone.name}", record_type)
+        for label in labels_to_query
+        for record_type in _QUERY_RECORD_TYPES
+    ]
+
+    workers = min(_MAX_QUERY_WORKERS, len(probes))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda probe: _query_records(cache, *probe), probes)
+        current_records = [record for found in results for record in found]
 
     logger.info(f"Found {len(current_records)} current DNS record(s) for zone: {zone.name}")
     return current_records
 
 
-def compare_dns_state(zone: Zone) -> DNSStateDiff:
+def _query_records(
+    cache: DigCache, label: str, fqdn: str, record_type: str
+) -> list[DNSRecordState]:
+    """Look up one record type for one name and parse the results.
+
+    Args:
+        cache: Lookup cache for the current run
+        label: The zone-relative label being queried
+        fqdn: Fully qualified name passed to dig
+        record_type: DNS record type to query
+
+    Returns:
+        Parsed records, or an empty list if the lookup failed
+    """
+    try:
+        results = cache.get_or_fetch(fqdn, record_type)
+        if results:
+            logger.debug(f"Found {len(results)} {record_type} record(s) for {fqdn}")
+        # Parse the result based on record type
+        return [_parse_dns_record(label, record_type, value) for value in results]
+    except Exception as e:
+        logger.warning(f"Failed to query {record_type} records for {fqdn}: {e}")
+        return []
+
+
+def compare_dns_state(zone: Zone, cache: DigCache | None = None) -> DNSStateDiff:
     """Compare current DNS state with desired configuration.
 
     Args:
         zone: The zone with desired configuration
+        cache: Optional lookup cache shared with other queries in the same run
 
     Returns:
         DNSStateDiff object with comparison results
     """
     logger.info(f"Comparing DNS state for zone: {zone.name}")
 
-    current_records = query_current_dns_state(zone)
+    current_records = query_current_dns_state(zone, cache)
     desired_records = zone.records
     changes: list[RecordChange] = []
 
-    # Create sets for easier comparison
-    # Use enhanced key that includes priority/weight/port for MX/SRV records
+    # Index current records by an enhanced key that includes priority/weight/port
+    # for MX/SRV records
     current_set = {
         _record_key_enhanced(r.label, r.type, r.value, r.priority, r.weight, r.port): r
         for r in current_records
     }
+
+    # Index desired records the same way; of duplicates, the last one wins
     desired_set = {
         _record_key_enhanced(r.label, r.type, r.value, r.priority, r.weight, r.port): r
         for r in desired_records
     }
 
-    # Find records to create (in desired but not in current)
     for key, desired_record in desired_set.items():
-        if key not in current_set:
+        current_record = current_set.get(key)
+        if current_record is None:
+            # Record to create (in desired but not in current)
             logger.debug(
                 f"Record to create: {desired_record.label} {desired_record.type} {desired_record.value}"
             )
             changes.append(RecordChange(action="create", record=desired_record))
-        else:
-            # Record exists, check if it needs updating (TTL or other fields)
-            current_record = current_set[key]
-            if _needs_update(current_record, desired_record):
-                logger.debug(
-                    f"Record to update: {desired_record.label} {desired_record.type} {desired_record.value}"
-                )
-                # Convert current DNSRecordState to Record for comparison
-                previous = _dns_state_to_record(current_record)
-                changes.append(
-                    RecordChange(action="update", record=desired_record, previous=previous)
-                )
+        elif _needs_update(current_record, desired_record):
+            # Record exists, but other fields (priority/weight/port) differ
+            logger.debug(
+                f"Record to update: {desired_record.label} {desired_record.type} {desired_record.value}"
+            )
+            # Convert current DNSRecordState to Record for comparison
+            previous = _dns_state_to_record(current_record)
+            changes.append(RecordChange(action="update", record=desired_record, previous=previous))
 
     # Find records to delete (in current but not in desired)
     for key, current_record in current_set.items():
@@ -154,17 +214,18 @@ def compare_dns_state(zone: Zone) -> DNSStateDiff:
     )
 
 
-def validate_dns_state(zone: Zone) -> tuple[bool, list[str]]:
+def validate_dns_state(zone: Zone, cache: DigCache | None = None) -> tuple[bool, list[str]]:
     """Validate that current DNS state matches desired configuration.
 
     Args:
         zone: The zone to validate
+        cache: Optional lookup cache shared with other queries in the same run
 
     Returns:
         Tuple of (is_valid, list of validation errors/warnings)
     """
     logger.info(f"Validating DNS state for zone: {zone.name}")
-    diff = compare_dns_state(zone)
+    diff = compare_dns_state(zone, cache)
 
     warnings: list[str] = []
     is_valid = not diff.has_changes()
@@ -206,9 +267,12 @@ def _record_key_enhanced(
     priority: int | None = None,
     weight: int | None = None,
     port: int | None = None,
-) -> str:
+) -> RecordKey:
     """Generate a unique key for a DNS record including priority/weight/port.
 
+    A tuple hashes without building an intermediate string and cannot collide
+    when a value itself contains the separator a joined string would use.
+
     Args:
         label: DNS label
         record_type: Record type
@@ -218,23 +282,9 @@ def _record_key_enhanced(
         port: Port (for SRV)
 
     Returns:
-        Unique key string
+        Unique key tuple
     """
-    key_parts = [label, record_type, value]
-
-    # Include priority for MX and SRV records
-    if priority is not None:
-        key_parts.append(f"p{priority}")
-
-    # Include weight for SRV records
-    if weight is not None:
-        key_parts.append(f"w{weight}")
-
-    # Include port for SRV records
-    if port is not None:
-        key_parts.append(f"port{port}")
-
-    return ":".join(key_parts)
+    return (label, record_type, value, priority, weight, port)
 
 
 def _parse_dns_record(label: str, record_type: str, value: str) -> DNSRecordState:
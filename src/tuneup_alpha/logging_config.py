@@ -2,22 +2,29 @@
 
 from __future__ import annotations
 
+import atexit
 import contextvars
+import copy
 import json
 import logging
 import logging.handlers
+import queue
 import sys
 import uuid
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 # Context variable for correlation ID
 correlation_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "correlation_id", default=None
 )
 
+# Shared encoder for structured logs: compact separators keep lines short and
+# default=str keeps non-JSON extras (paths, enums) from failing the record.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), default=str)
+
 
 class LogLevel(str, Enum):
     """Available log levels."""
@@ -36,6 +43,29 @@ class LogOutput(str, Enum):
     BOTH = "both"
 
 
+class CorrelationIdFilter(logging.Filter):
+    """Stamp each record with the correlation ID active when it was logged.
+
+    Formatters then read a plain record attribute instead of the context
+    variable, which keeps the ID correct even if a record is formatted later
+    or in another thread.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Attach the current correlation ID to the record."""
+        record.correlation_id = correlation_id.get()
+        return True
+
+
+def _record_correlation_id(record: logging.LogRecord) -> str | None:
+    """Return the ID stamped by CorrelationIdFilter, falling back to the context."""
+    try:
+        stamped: str | None = record.correlation_id  # type: ignore[attr-defined]
+    except AttributeError:
+        return correlation_id.get()
+    return stamped
+
+
 class StructuredFormatter(logging.Formatter):
     """Custom formatter that outputs structured JSON logs."""
 
@@ -52,7 +82,7 @@ class StructuredFormatter(logging.Formatter):
         }
 
         # Add correlation ID if present
-        corr_id = correlation_id.get()
+        corr_id = _record_correlation_id(record)
         if corr_id:
             log_data["correlation_id"] = corr_id
 
@@ -64,7 +94,7 @@ class StructuredFormatter(logging.Formatter):
         if hasattr(record, "extra_fields"):
             log_data.update(record.extra_fields)
 
-        return json.dumps(log_data)
+        return _JSON_ENCODER.encode(log_data)
 
 
 class HumanReadableFormatter(logging.Formatter):
@@ -77,7 +107,7 @@ class HumanReadableFormatter(logging.Formatter):
         name = record.name
 
         # Add correlation ID if present
-        corr_id = correlation_id.get()
+        corr_id = _record_correlation_id(record)
         corr_str = f" [{corr_id[:8]}]" if corr_id else ""
 
         # Build the message
@@ -110,6 +140,7 @@ class LoggingConfig:
         max_bytes: int = 10 * 1024 * 1024,  # 10MB
         backup_count: int = 5,
         structured: bool = False,
+        stream: TextIO | None = None,
     ) -> None:
         """
         Initialize logging configuration.
@@ -121,6 +152,7 @@ class LoggingConfig:
             max_bytes: Maximum size of log file before rotation
             backup_count: Number of backup log files to keep
             structured: Whether to use structured JSON logging
+            stream: Stream for console output (defaults to stdout)
         """
         self.level = level
         self.output = output
@@ -128,36 +160,85 @@ class LoggingConfig:
         self.max_bytes = max_bytes
         self.backup_count = backup_count
         self.structured = structured
+        self.stream = stream
 
         # Validate configuration
         if output in (LogOutput.FILE, LogOutput.BOTH) and log_file is None:
             raise ValueError("log_file is required when output is 'file' or 'both'")
 
 
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """Queue records for the background writer without pre-formatting them.
+
+    The stock QueueHandler formats records and drops ``exc_info`` so they can
+    cross process boundaries. The queue here is in-process, so only the
+    message is frozen and the listener's formatter still sees the exception
+    and the extra fields. Like the stock handler, it queues a copy, so other
+    handlers of the same record still see the original arguments.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return a copy of ``record`` with its message arguments frozen."""
+        queued = copy.copy(record)
+        queued.msg = record.getMessage()
+        queued.args = None
+        return queued
+
+
+# Background thread writing file logs; replaced on every setup_logging() call
+_file_listener: logging.handlers.QueueListener | None = None
+
+
+def shutdown_logging() -> None:
+    """Stop the background file writer, flushing queued records to disk."""
+    global _file_listener
+    if _file_listener is None:
+        return
+    listener, _file_listener = _file_listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(shutdown_logging)
+
+
 def setup_logging(config: LoggingConfig | None = None) -> None:
     """
     Configure logging for the application.
 
+    File output is written by a background thread: loggers only enqueue the
+    record, so callers never wait on disk I/O or the rotation lock. Call
+    shutdown_logging() to flush pending records; it also runs at exit.
+
     Args:
         config: Logging configuration. If None, uses default configuration.
     """
+    global _file_listener
+
     if config is None:
         config = LoggingConfig()
 
+    shutdown_logging()
+
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, config.level.value))
 
-    # Remove existing handlers
-    root_logger.handlers.clear()
+    # Remove existing handlers, closing them so log files are not left open
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
 
     # Choose formatter
     formatter = StructuredFormatter() if config.structured else HumanReadableFormatter()
+    correlation_filter = CorrelationIdFilter()
 
     # Add console handler if needed
     if config.output in (LogOutput.CONSOLE, LogOutput.BOTH):
-        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler = logging.StreamHandler(config.stream or sys.stdout)
         console_handler.setFormatter(formatter)
+        console_handler.addFilter(correlation_filter)
         root_logger.addHandler(console_handler)
 
     # Add file handler if needed
@@ -172,7 +253,17 @@ def setup_logging(config: LoggingConfig | None = None) -> None:
             backupCount=config.backup_count,
         )
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+
+        # The filter runs on the queue handler so IDs are stamped in the caller's context
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = _RecordQueueHandler(log_queue)
+        queue_handler.addFilter(correlation_filter)
+        root_logger.addHandler(queue_handler)
+
+        _file_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _file_listener.start()
 
 
 def get_logger(name: str) -> logging.Logger:
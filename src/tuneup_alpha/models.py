@@ -2,19 +2,67 @@
 
 from __future__ import annotations
 
+import ipaddress
 import re
 from pathlib import Path
-from typing import Literal
+from typing import Literal, get_args
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 RecordType = Literal["A", "AAAA", "CNAME", "MX", "TXT", "SRV", "NS", "CAA"]
 RecordAction = Literal["create", "delete", "update"]
 
+# Membership set for callers that check raw strings before building a Record.
+RECORD_TYPES: frozenset[str] = frozenset(get_args(RecordType))
+
+# Compiled once at import time; the validators below run for every Record.
+_LABEL_SEGMENT_RE = re.compile(r"^[A-Za-z0-9@_-]+$")
+
+# Host names as record values and as lookup input: dot-separated labels of
+# at most 63 characters (253 in total), optionally fully qualified. Like
+# record labels they may contain underscores (_dmarc, _sip._tcp), and
+# hyphens may not start or end a label.
+HOSTNAME_RE = re.compile(
+    r"^(?=.{1,253}\.?$)[A-Za-z0-9_]([A-Za-z0-9_-]{0,61}[A-Za-z0-9_])?"
+    r"(\.[A-Za-z0-9_]([A-Za-z0-9_-]{0,61}[A-Za-z0-9_])?)*\.?$",
+    re.ASCII,
+)
+
+
+def validate_label(v: str) -> str:
+    """Check a relative DNS label, raising ValueError when it is malformed."""
+
+    if v == "@":
+        return v
+
+    if v.startswith("."):
+        raise ValueError("DNS labels cannot start with a dot")
+
+    trimmed_value = v[:-1] if v.endswith(".") else v
+    if not trimmed_value:
+        raise ValueError("DNS labels must contain at least one character")
+
+    for part in trimmed_value.split("."):
+        if not part:
+            raise ValueError("DNS labels cannot contain empty segments (consecutive dots)")
+        if part.startswith("-") or part.endswith("-"):
+            raise ValueError("DNS label segments cannot start or end with a hyphen")
+        if len(part) > 63:
+            raise ValueError(f"DNS label segment '{part}' exceeds maximum length of 63 characters")
+        if not _LABEL_SEGMENT_RE.match(part):
+            raise ValueError(
+                f"Invalid DNS label '{v}'. Labels may contain letters, digits, hyphens, dots, underscores, and '@'."
+            )
+
+    return v
+
 
 class Record(BaseModel):
     """Single DNS record managed by the application."""
 
+    # Records are replaced, never edited in place, so they can be shared and hashed.
+    model_config = ConfigDict(frozen=True)
+
     label: str = Field(
         ...,
         description="Relative record label (use '@' for the zone apex).",
@@ -39,33 +87,7 @@ class Record(BaseModel):
     def validate_label(cls, v: str) -> str:
         """Validate DNS label format."""
 
-        if v == "@":
-            return v
-
-        if v.startswith("."):
-            raise ValueError("DNS labels cannot start with a dot")
-
-        trimmed_value = v[:-1] if v.endswith(".") else v
-        if not trimmed_value:
-            raise ValueError("DNS labels must contain at least one character")
-
-        label_pattern = re.compile(r"^[A-Za-z0-9@_-]+$")
-
-        for part in trimmed_value.split("."):
-            if not part:
-                raise ValueError("DNS labels cannot contain empty segments (consecutive dots)")
-            if part.startswith("-") or part.endswith("-"):
-                raise ValueError("DNS label segments cannot start or end with a hyphen")
-            if len(part) > 63:
-                raise ValueError(
-                    f"DNS label segment '{part}' exceeds maximum length of 63 characters"
-                )
-            if not label_pattern.match(part):
-                raise ValueError(
-                    f"Invalid DNS label '{v}'. Labels may contain letters, digits, hyphens, dots, underscores, and '@'."
-                )
-
-        return v
+        return validate_label(v)
 
     @field_validator("value")
     @classmethod
@@ -77,46 +99,31 @@ class Record(BaseModel):
         record_type = info.data["type"]
 
         if record_type == "A":
-            # Validate IPv4 address format
-            ipv4_pattern = r"^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$"
-            match = re.match(ipv4_pattern, v)
-            if not match:
-                raise ValueError(f"Invalid IPv4 address '{v}'")
-            # Check each octet is 0-255
-            for octet in match.groups():
-                if int(octet) > 255:
-                    raise ValueError(f"Invalid IPv4 address '{v}' - octet out of range")
+            try:
+                ipaddress.IPv4Address(v)
+            except ValueError as exc:
+                raise ValueError(f"Invalid IPv4 address '{v}'") from exc
         elif record_type == "AAAA":
-            # Validate IPv6 address format
-            # Basic IPv6 validation - accepts full and compressed forms
-            ipv6_pattern = r"^(([0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,7}:|([0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,5}(:[0-9a-fA-F]{1,4}){1,2}|([0-9a-fA-F]{1,4}:){1,4}(:[0-9a-fA-F]{1,4}){1,3}|([0-9a-fA-F]{1,4}:){1,3}(:[0-9a-fA-F]{1,4}){1,4}|([0-9a-fA-F]{1,4}:){1,2}(:[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:((:[0-9a-fA-F]{1,4}){1,6})|:((:[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(:[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|::(ffff(:0{1,4}){0,1}:){0,1}((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])|([0-9a-fA-F]{1,4}:){1,4}:((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9]))$"
-            if not re.match(ipv6_pattern, v):
-                raise ValueError(f"Invalid IPv6 address '{v}'")
+            try:
+                ipaddress.IPv6Address(v)
+            except ValueError as exc:
+                raise ValueError(f"Invalid IPv6 address '{v}'") from exc
         elif record_type == "CNAME":
             # CNAME can be @ or a valid hostname
-            if v != "@":
-                # Basic hostname validation
-                hostname_pattern = r"^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?)*\.?$"
-                if not re.match(hostname_pattern, v):
-                    raise ValueError(f"Invalid hostname '{v}' for CNAME record")
+            if v != "@" and not HOSTNAME_RE.match(v):
+                raise ValueError(f"Invalid hostname '{v}' for CNAME record")
         elif record_type == "MX":
             # MX value is a mail server hostname
-            if v != "@":
-                hostname_pattern = r"^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?)*\.?$"
-                if not re.match(hostname_pattern, v):
-                    raise ValueError(f"Invalid mail server hostname '{v}' for MX record")
+            if v != "@" and not HOSTNAME_RE.match(v):
+                raise ValueError(f"Invalid mail server hostname '{v}' for MX record")
         elif record_type == "NS":
             # NS value is a nameserver hostname
-            if v != "@":
-                hostname_pattern = r"^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?)*\.?$"
-                if not re.match(hostname_pattern, v):
-                    raise ValueError(f"Invalid nameserver hostname '{v}' for NS record")
+            if v != "@" and not HOSTNAME_RE.match(v):
+                raise ValueError(f"Invalid nameserver hostname '{v}' for NS record")
         elif record_type == "SRV":
             # SRV value is a target hostname
-            if v != "@" and v != ".":
-                hostname_pattern = r"^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?)*\.?$"
-                if not re.match(hostname_pattern, v):
-                    raise ValueError(f"Invalid target hostname '{v}' for SRV record")
+            if v not in ("@", ".") and not HOSTNAME_RE.match(v):
+                raise ValueError(f"Invalid target hostname '{v}' for SRV record")
         elif record_type == "TXT":
             # TXT records can contain any text, but check for reasonable length
             # DNS TXT records have a limit of 255 characters per string, but multiple strings can be used
@@ -206,6 +213,9 @@ class AppConfig(BaseModel):
     prefix_key_path: str = Field(
         default="~/.config/nsupdate", description="Default path prefix for nsupdate key files"
     )
+    reverse_lookup: bool = Field(
+        default=False, description="Look up reverse DNS for IPv4 values in the record dialog"
+    )
     logging: LoggingConfig = Field(
         default_factory=LoggingConfig, description="Logging configuration"
     )
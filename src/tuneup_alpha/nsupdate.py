@@ -17,7 +17,7 @@ class NsupdateError(RuntimeError):
     """Raised when nsupdate exits with an error."""
 
 
-@dataclass
+@dataclass(slots=True)
 class NsupdatePlan:
     """Sequence of changes that can be rendered into an nsupdate script."""
 
@@ -36,8 +36,10 @@ class NsupdatePlan:
         lines = [f"server {self.zone.server}", f"zone {self.zone.name}"]
         for change in self.changes:
             lines.extend(_render_change(self.zone, change))
-        lines.append("send")
-        script = "\n".join(lines) + "\n"
+        # The trailing empty entry makes join() emit the final newline without
+        # copying the whole script a second time.
+        lines.extend(("send", ""))
+        script = "\n".join(lines)
         logger.debug(f"Generated nsupdate script with {len(self.changes)} change(s)")
         return script
 
@@ -286,6 +286,10 @@ class ZoneDashboard(App):
         if not payload:
             return
         original_name, zone = payload
+        if original_name and any(existing is zone for existing in self._config.zones):
+            # The form returns the zone it was given when nothing was edited
+            self.notify(f"Zone '{zone.name}' unchanged", severity="information")
+            return
         try:
             if original_name:
                 self.config_repo.update_zone(original_name, zone)
@@ -339,7 +343,7 @@ class ZoneDashboard(App):
             return
         zone_name = zone.name
         self.push_screen(
-            RecordFormScreen("add", zone_name),
+            RecordFormScreen("add", zone_name, reverse_lookup=self._config.reverse_lookup),
             lambda payload: self._handle_record_saved(zone_name, payload),
         )
 
@@ -351,7 +355,13 @@ class ZoneDashboard(App):
         zone, record, index = current
         zone_name = zone.name
         self.push_screen(
-            RecordFormScreen("edit", zone_name, record=record, record_index=index),
+            RecordFormScreen(
+                "edit",
+                zone_name,
+                record=record,
+                record_index=index,
+                reverse_lookup=self._config.reverse_lookup,
+            ),
             lambda payload: self._handle_record_saved(zone_name, payload),
         )
 
@@ -2,27 +2,235 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Literal, cast
+from typing import Any, Literal, TypeVar, cast
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
-from textual.screen import ModalScreen
+from textual.screen import ModalScreen, Screen
+from textual.timer import Timer
 from textual.widgets import Button, Input, Static
 
 from .dns_lookup import (
     dns_lookup,
     dns_lookup_label,
     dns_lookup_label_with_type,
+    is_hostname,
+    is_ipv4,
+    is_ipv6,
     lookup_a_records,
     lookup_nameservers,
 )
-from .models import Record, RecordType, Zone
+from .logging_config import get_logger
+from .models import RECORD_TYPES, Record, RecordType, Zone, validate_label
+
+logger = get_logger(__name__)
 
 ZoneFormResult = tuple[str | None, Zone]
 RecordFormResult = tuple[int | None, Record, str | None]
 
+_T = TypeVar("_T")
+
+# How long a resolver answer is reused while the user keeps editing a form;
+# empty answers expire sooner so a record created meanwhile shows up quickly
+_LOOKUP_TTL_SECONDS = 60.0
+_NEGATIVE_LOOKUP_TTL_SECONDS = 30.0
+_LOOKUP_CACHE_SIZE = 512
+
+# Resolver calls block on network round trips, so the forms run them here
+# rather than on the Textual event loop
+_DNS_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dns")
+
+# Quiet period after the last keystroke before a lookup is started
+_LOOKUP_DEBOUNCE_SECONDS = 0.2
+
+# Replaces the "Looking up" cue when a resolver call raised instead of answering
+_LOOKUP_FAILED_CUE = "[red]✗[/red] [dim]DNS lookup failed[/dim]"
+
+# Record value cues by suggested type: the lookup result key holding the
+# answer (None when there is nothing to look up), then the cue shown when
+# the answer was found and when it was not
+_IPV4_DETECTED_CUE = "[green]✓[/green] [cyan]IPv4 address detected[/cyan]"
+
+_VALUE_LOOKUP_CUES: dict[str, tuple[str | None, str, str]] = {
+    "A": (
+        "hostname",
+        "[green]✓[/green] [cyan]Reverse DNS: {}[/cyan]",
+        "[yellow]○[/yellow] [dim]No reverse DNS found[/dim]",
+    ),
+    "AAAA": (
+        None,
+        "[green]✓[/green] [cyan]IPv6 address detected[/cyan]",
+        "[green]✓[/green] [cyan]IPv6 address detected[/cyan]",
+    ),
+    "CNAME": (
+        "ip",
+        "[green]✓[/green] [cyan]Forward DNS: {}[/cyan]",
+        "[yellow]○[/yellow] [dim]No forward DNS found[/dim]",
+    ),
+}
+
+
+@dataclass
+class _LookupCache:
+    """Bounded, time-limited memo of resolver answers for a single form.
+
+    Entries are keyed on the resolver function and its arguments, so typing
+    back over a value that was already looked up does not hit DNS again.
+    Answers that found nothing are kept for ``negative_ttl`` instead of
+    ``ttl``. The least recently used entry is evicted once ``maxsize`` is
+    exceeded.
+    """
+
+    ttl: float = _LOOKUP_TTL_SECONDS
+    negative_ttl: float = _NEGATIVE_LOOKUP_TTL_SECONDS
+    maxsize: int = _LOOKUP_CACHE_SIZE
+    _entries: OrderedDict[tuple[Any, ...], tuple[float, Any]] = field(default_factory=OrderedDict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def peek(self, func: Callable[..., _T], *args: str) -> tuple[bool, _T | None]:
+        """Return ``(True, answer)`` if ``func(*args)`` has a fresh answer, else ``(False, None)``."""
+        key = (func, *args)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return False, None
+            self._entries.move_to_end(key)
+            return True, cast(_T, entry[1])
+
+    def get_or_call(self, func: Callable[..., _T], *args: str) -> _T:
+        """Return the cached answer for ``func(*args)``, calling it on a miss or expiry."""
+        hit, answer = self.peek(func, *args)
+        if hit:
+            return cast(_T, answer)
+
+        key = (func, *args)
+        # Resolve outside the lock so a slow query does not block other lookups
+        result = func(*args)
+        ttl = self.ttl if _found_anything(result) else self.negative_ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+
+def _found_anything(result: object) -> bool:
+    """Tell whether a resolver answer holds a result rather than "nothing found".
+
+    ``dns_lookup`` returns ``(type, {"ip" | "hostname": answer})`` and
+    ``dns_lookup_label`` returns ``(type, value)``. The suggested type is
+    derived from the input's shape rather than from DNS, so only the answer
+    part counts. The other resolvers return a value or list, empty or None
+    when nothing was found.
+    """
+    if isinstance(result, tuple):
+        result = result[1]
+    if isinstance(result, dict):
+        return any(result.values())
+    return bool(result)
+
+
+@dataclass
+class _LookupRunner:
+    """Runs a form's resolver calls on the DNS executor and applies the answers.
+
+    Each lookup belongs to a channel (for example the record value or the
+    label). Only the most recent lookup on a channel is applied, so a slow
+    answer for an earlier keystroke cannot overwrite the current one. When a
+    lookup raises, the error is logged and ``failed`` is called instead.
+    """
+
+    failed: Callable[[], None] | None = None
+    cache: _LookupCache = field(default_factory=_LookupCache)
+    executor: Executor = field(default_factory=lambda: _DNS_EXECUTOR)
+    _latest: dict[str, object] = field(default_factory=dict)
+    _timers: dict[str, Timer] = field(default_factory=dict)
+
+    def debounce(
+        self,
+        screen: Screen[Any],
+        channel: str,
+        callback: Callable[[], None],
+        *,
+        immediate: bool = False,
+    ) -> None:
+        """Call ``callback`` once ``channel`` has had no new input for a short while.
+
+        Args:
+            screen: The form issuing the lookup.
+            channel: Name of the field the lookup is for.
+            callback: Starts the lookup for the field's latest value.
+            immediate: Call ``callback`` right away, e.g. when the field was
+                cleared and there is nothing to wait for.
+        """
+        self.cancel(channel)
+        if immediate:
+            callback()
+            return
+        self._timers[channel] = screen.set_timer(_LOOKUP_DEBOUNCE_SECONDS, callback)
+
+    def cancel(self, channel: str) -> None:
+        """Drop the pending or in-flight lookup on ``channel``."""
+        pending = self._timers.pop(channel, None)
+        if pending is not None:
+            pending.stop()
+        # An answer still on its way no longer matches the latest token
+        self._latest.pop(channel, None)
+
+    def run(
+        self,
+        screen: Screen[Any],
+        channel: str,
+        fetch: Callable[[], _T],
+        apply: Callable[[_T], None],
+    ) -> None:
+        """Call ``fetch`` on the executor and pass its result to ``apply`` on the event loop.
+
+        Args:
+            screen: The form issuing the lookup.
+            channel: Name of the field the lookup is for.
+            fetch: Blocking callable performing the resolver queries.
+            apply: Callback updating the form with the result of ``fetch``.
+        """
+        token = object()
+        self._latest[channel] = token
+        caller = threading.get_ident()
+        app = screen.app if screen.is_attached else None
+
+        def deliver(update: Callable[[], None]) -> None:
+            # Superseded lookups and forms dismissed since the lookup started are skipped
+            if self._latest.get(channel) is not token:
+                return
+            if app is not None and not screen.is_attached:
+                return
+            update()
+
+        def task() -> None:
+            try:
+                result = fetch()
+            except Exception as exc:
+                logger.warning(f"DNS lookup for {channel} failed: {exc}")
+                update = self.failed or (lambda: None)
+            else:
+                update = partial(apply, result)
+            if threading.get_ident() == caller:
+                # An executor that runs tasks inline answers before submit() returns
+                deliver(update)
+            elif app is not None:
+                app.call_from_thread(deliver, update)
+
+        self.executor.submit(task)
+
 
 class ZoneFormScreen(ModalScreen[ZoneFormResult | None]):
     """Modal dialog that captures the fields required to define or edit a zone."""
@@ -56,6 +264,8 @@ class ZoneFormScreen(ModalScreen[ZoneFormResult | None]):
         self._info: Static | None = None
         self._discovered_ns: list[str] = []
         self._discovered_a_records: list[str] = []
+        self._lookups = _LookupRunner(failed=self._show_lookup_failure)
+        self._inputs: dict[str, Input] = {}
 
     def compose(self) -> ComposeResult:
         title = "Add Managed Zone" if self.mode == "add" else "Edit Managed Zone"
@@ -104,7 +314,10 @@ class ZoneFormScreen(ModalScreen[ZoneFormResult | None]):
                 yield Button(button_label, id="save", variant="success")
 
     def on_mount(self) -> None:
-        self.query_one("#zone-name", Input).focus()
+        self._input("#zone-name").focus()
+
+    def on_unmount(self) -> None:
+        self._inputs.clear()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "cancel":
@@ -118,11 +331,17 @@ class ZoneFormScreen(ModalScreen[ZoneFormResult | None]):
             self._error.update("")
 
         if event.input.id == "zone-name":
-            self._perform_zone_lookup(event.value, generate_key_path=False)
+            self._lookups.debounce(
+                self,
+                "zone",
+                partial(self._perform_zone_lookup, event.value, generate_key_path=False),
+                immediate=not event.value.strip(),
+            )
 
     def on_input_blurred(self, event: Input.Blurred) -> None:
         """Handle input blur to perform DNS lookup on zone name field."""
         if event.input.id == "zone-name":
+            self._lookups.cancel("zone")
             self._perform_zone_lookup(event.input.value, generate_key_path=True)
 
     def _perform_zone_lookup(self, domain: str, *, generate_key_path: bool = True) -> None:
@@ -139,7 +358,9 @@ class ZoneFormScreen(ModalScreen[ZoneFormResult | None]):
         if self._info:
             self._info.update("")
 
-        if not domain or not domain.strip():
+        # Nothing to resolve for empty or half-typed names such as "example-" or
+        # "example..com"; a trailing dot is a valid fully qualified name
+        if not domain or not is_hostname(domain.strip()):
             self._discovered_ns = []
             self._discovered_a_records = []
             return
@@ -147,25 +368,55 @@ class ZoneFormScreen(ModalScreen[ZoneFormResult | None]):
         if self._original_name and domain.strip() == self._original_name:
             return
 
+        domain = domain.strip()
+
+        # Fresh cached answers, including empty ones, are applied without a worker round trip
+        cache = self._lookups.cache
+        ns_hit, cached_ns = cache.peek(lookup_nameservers, domain)
+        a_hit, cached_a = cache.peek(lookup_a_records, domain)
+        if ns_hit and a_hit:
+            self._lookups.cancel("zone")
+            self._apply_zone_result(
+                domain, cached_ns or [], cached_a or [], generate_key_path=generate_key_path
+            )
+            return
+
         if self._info:
             self._info.update("[yellow]⏳ Looking up DNS records...[/yellow]")
 
-        domain = domain.strip()
+        def fetch() -> tuple[list[str], list[str]]:
+            # The two queries are independent, so overlap their round trips
+            cached = self._lookups.cache.get_or_call
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                nameservers, a_records = executor.map(
+                    lambda lookup: cached(lookup, domain), (lookup_nameservers, lookup_a_records)
+                )
+            return nameservers, a_records
 
-        nameservers = lookup_nameservers(domain)
-        self._discovered_ns = nameservers
+        def apply(found: tuple[list[str], list[str]]) -> None:
+            self._apply_zone_result(domain, *found, generate_key_path=generate_key_path)
+
+        self._lookups.run(self, "zone", fetch, apply)
 
-        a_records = lookup_a_records(domain)
+    def _apply_zone_result(
+        self,
+        domain: str,
+        nameservers: list[str],
+        a_records: list[str],
+        *,
+        generate_key_path: bool,
+    ) -> None:
+        self._discovered_ns = nameservers
         self._discovered_a_records = a_records
 
-        server_input = self.query_one("#zone-server", Input)
+        server_input = self._input("#zone-server")
         if nameservers and not server_input.value.strip():
             server_input.value = nameservers[0]
 
         if self.mode == "add" and generate_key_path:
-            key_input = self.query_one("#zone-key", Input)
+            key_input = self._input("#zone-key")
             if not key_input.value.strip():
-                key_input.value = f"{self._prefix_key_path}/{domain}.key"
+                key_input.value = self._default_key_path(domain)
 
         self._show_zone_lookup_info(nameservers, a_records)
 
@@ -220,7 +471,19 @@ class ZoneFormScreen(ModalScreen[ZoneFormResult | None]):
         server = self._value("#zone-server")
         key = self._value("#zone-key")
         ttl_text = self._value("#zone-ttl") or "3600"
-        notes = self.query_one("#zone-notes", Input).value.strip()
+        notes = self._input("#zone-notes").value.strip()
+
+        initial = self._initial_zone
+        if (
+            initial is not None
+            and name == initial.name
+            and server == initial.server
+            and key == str(initial.key_file)
+            and ttl_text == str(initial.default_ttl)
+            and (notes or None) == initial.notes
+        ):
+            # Nothing was edited: hand back the original so the caller can skip the save
+            return initial
 
         if not name:
             raise ValueError("Zone name is required.")
@@ -229,7 +492,7 @@ class ZoneFormScreen(ModalScreen[ZoneFormResult | None]):
 
         # Generate default key file path if not provided (fallback for add mode)
         if not key and self.mode == "add":
-            key = f"{self._prefix_key_path}/{name}.key"
+            key = self._default_key_path(name)
 
         if not key:
             raise ValueError("Key file path is required.")
@@ -267,13 +530,28 @@ class ZoneFormScreen(ModalScreen[ZoneFormResult | None]):
             records=existing_records,
         )
 
+    def _default_key_path(self, zone_name: str) -> str:
+        # Shown as configured; "~" is left for the user to see rather than expanded
+        return f"{self._prefix_key_path}/{zone_name}.key"
+
     def _value(self, selector: str) -> str:
-        return self.query_one(selector, Input).value.strip()
+        return self._input(selector).value.strip()
+
+    def _input(self, selector: str) -> Input:
+        # Inputs are composed once per form, so each is queried only on first use
+        widget = self._inputs.get(selector)
+        if widget is None:
+            widget = self._inputs[selector] = self.query_one(selector, Input)
+        return widget
 
     def _show_error(self, message: str) -> None:
         if self._error:
             self._error.update(f"[red]{message}[/red]")
 
+    def _show_lookup_failure(self) -> None:
+        if self._info:
+            self._info.update(_LOOKUP_FAILED_CUE)
+
     def _focus_relative_input(self, delta: int, *, wrap: bool) -> bool:
         focused = self.app.focused
         current_id = focused.id if isinstance(focused, Input) else None
@@ -290,7 +568,7 @@ class ZoneFormScreen(ModalScreen[ZoneFormResult | None]):
             target %= len(self._FIELD_IDS)
 
         field_id = self._FIELD_IDS[target]
-        self.query_one(f"#{field_id}", Input).focus()
+        self._input(f"#{field_id}").focus()
         return True
 
 
@@ -319,18 +597,22 @@ class RecordFormScreen(ModalScreen[RecordFormResult | None]):
         zone_name: str,
         record: Record | None = None,
         record_index: int | None = None,
+        reverse_lookup: bool = False,
     ) -> None:
         super().__init__()
         self.mode = mode
         self.zone_name = zone_name
         self._initial_record = record
         self._record_index = record_index
+        self._reverse_lookup = reverse_lookup
         self._error: Static | None = None
         self._info: Static | None = None
         self._discovered_cname_target: str | None = None
         # Track last lookup to avoid redundant lookups
         self._last_lookup_label: str | None = None
         self._last_lookup_type: str | None = None
+        self._lookups = _LookupRunner(failed=self._show_lookup_failure)
+        self._inputs: dict[str, Input] = {}
 
     def compose(self) -> ComposeResult:
         title = (
@@ -398,7 +680,10 @@ class RecordFormScreen(ModalScreen[RecordFormResult | None]):
                 yield Button(button_label, id="save", variant="success")
 
     def on_mount(self) -> None:
-        self.query_one("#record-label", Input).focus()
+        self._input("#record-label").focus()
+
+    def on_unmount(self) -> None:
+        self._inputs.clear()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "cancel":
@@ -408,11 +693,23 @@ class RecordFormScreen(ModalScreen[RecordFormResult | None]):
 
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "record-value":
-            self._perform_dns_lookup(event.value)
+            self._lookups.debounce(
+                self,
+                "value",
+                partial(self._perform_dns_lookup, event.value),
+                immediate=not event.value.strip(),
+            )
         elif event.input.id == "record-label":
-            self._perform_label_type_lookup(event.value, None)
+            self._lookups.debounce(
+                self,
+                "label",
+                partial(self._perform_label_type_lookup, event.value, None),
+                immediate=not event.value.strip(),
+            )
         elif event.input.id == "record-type":
-            self._perform_label_type_lookup(None, event.value)
+            self._lookups.debounce(
+                self, "label", partial(self._perform_label_type_lookup, None, event.value)
+            )
 
     def _perform_label_type_lookup(self, label: str | None, record_type: str | None) -> None:
         """Perform DNS lookup when label or type changes.
@@ -421,81 +718,111 @@ class RecordFormScreen(ModalScreen[RecordFormResult | None]):
             label: New label value if label changed, None if only type changed
             record_type: New record type if type changed, None if only label changed
         """
-        if self._error:
-            self._error.update("")
-        if self._info:
-            self._info.update("")
-
         # Get current values from form
-        label_input = self.query_one("#record-label", Input)
-        type_input = self.query_one("#record-type", Input)
-        value_input = self.query_one("#record-value", Input)
+        label_input = self._input("#record-label")
+        type_input = self._input("#record-type")
 
         current_label = (label if label is not None else label_input.value).strip()
         current_type = (
             (record_type if record_type is not None else type_input.value).strip().upper()
         )
 
+        # Only lookup if the combination of label and type has changed; an edit
+        # that leaves both the same (e.g. trailing whitespace) keeps the result shown
+        if self._last_lookup_label == current_label and self._last_lookup_type == current_type:
+            return
+
+        if self._error:
+            self._error.update("")
+        if self._info:
+            self._info.update("")
+
         if not current_label:
             return
 
-        # Check if we need to perform a new lookup
-        # Only lookup if the combination of label and type has changed
-        if self._last_lookup_label == current_label and self._last_lookup_type == current_type:
+        # Labels that can never exist in DNS are not worth a lookup
+        try:
+            validate_label(current_label)
+        except ValueError:
             return
 
         # Clear discovered CNAME target when performing a new lookup
         self._discovered_cname_target = None
 
-        # Update tracking to prevent redundant lookups.
-        # Note: Tracking is updated before lookup execution to avoid repeated
-        # attempts for the same label/type combination, even if the lookup fails.
-        # This prevents excessive DNS queries when records don't exist.
-        self._last_lookup_label = current_label
-        self._last_lookup_type = current_type
-
         if self._info:
             self._info.update("[yellow]⏳ Looking up DNS record...[/yellow]")
 
+        cached = self._lookups.cache.get_or_call
+
         # If we have a specific type, do a type-specific lookup
-        if current_type and current_type in ("A", "AAAA", "CNAME", "MX", "TXT", "SRV", "NS", "CAA"):
-            value = dns_lookup_label_with_type(current_label, self.zone_name, current_type)
+        if current_type in RECORD_TYPES:
+            self._lookups.run(
+                self,
+                "label",
+                partial(
+                    cached, dns_lookup_label_with_type, current_label, self.zone_name, current_type
+                ),
+                partial(self._apply_typed_label_result, current_label, current_type),
+            )
+        else:
+            # Fall back to automatic type detection for unknown or empty types
+            self._lookups.run(
+                self,
+                "label",
+                partial(cached, dns_lookup_label, current_label, self.zone_name),
+                partial(self._apply_detected_label_result, current_label, current_type),
+            )
 
-            if value:
-                # Update value field with found result
-                value_input.value = value
+    def _remember_lookup(self, current_label: str, current_type: str) -> None:
+        # Tracking is updated when an answer is applied, including "nothing
+        # found", so the same label/type combination is not queried again.
+        # A lookup that was superseded before its answer arrived leaves it
+        # alone, so going back to that combination starts a fresh lookup.
+        self._last_lookup_label = current_label
+        self._last_lookup_type = current_type
 
-                if current_type == "CNAME":
-                    self._discovered_cname_target = value
+    def _apply_typed_label_result(
+        self, current_label: str, current_type: str, value: str | None
+    ) -> None:
+        self._remember_lookup(current_label, current_type)
+        if value:
+            # Update value field with found result
+            self._input("#record-value").value = value
 
-                if self._info:
-                    self._info.update(
-                        f"[green]✓[/green] [cyan]Found {current_type} record: {value}[/cyan]"
-                    )
-            else:
-                if self._info:
-                    self._info.update(
-                        f"[yellow]○[/yellow] [dim]No {current_type} record found for {current_label}[/dim]"
-                    )
+            if current_type == "CNAME":
+                self._discovered_cname_target = value
+
+            if self._info:
+                self._info.update(
+                    f"[green]✓[/green] [cyan]Found {current_type} record: {value}[/cyan]"
+                )
         else:
-            # Fall back to automatic type detection for unknown or empty types
-            detected_type, value = dns_lookup_label(current_label, self.zone_name)
+            if self._info:
+                self._info.update(
+                    f"[yellow]○[/yellow] [dim]No {current_type} record found for {current_label}[/dim]"
+                )
 
-            if detected_type and value:
-                # Update both type and value fields
-                type_input.value = detected_type
-                value_input.value = value
+    def _apply_detected_label_result(
+        self, current_label: str, current_type: str, found: tuple[str | None, str | None]
+    ) -> None:
+        self._remember_lookup(current_label, current_type)
+        detected_type, value = found
 
-                if detected_type == "CNAME":
-                    self._discovered_cname_target = value
+        if detected_type and value:
+            # Update both type and value fields
+            self._input("#record-type").value = detected_type
+            self._input("#record-value").value = value
 
-                if self._info:
-                    self._info.update(
-                        f"[green]✓[/green] [cyan]Found {detected_type} record: {value}[/cyan]"
-                    )
-            else:
-                if self._info:
-                    self._info.update("[yellow]○[/yellow] [dim]No existing DNS records found[/dim]")
+            if detected_type == "CNAME":
+                self._discovered_cname_target = value
+
+            if self._info:
+                self._info.update(
+                    f"[green]✓[/green] [cyan]Found {detected_type} record: {value}[/cyan]"
+                )
+        else:
+            if self._info:
+                self._info.update("[yellow]○[/yellow] [dim]No existing DNS records found[/dim]")
 
     def _perform_dns_lookup(self, value: str) -> None:
         if self._error:
@@ -503,16 +830,36 @@ class RecordFormScreen(ModalScreen[RecordFormResult | None]):
         if self._info:
             self._info.update("")
 
-        if not value or not value.strip():
+        value = value.strip()
+        # Only addresses and host names tell us anything; skip the resolver for
+        # TXT/MX/CAA values and other text
+        if not (is_ipv4(value) or is_ipv6(value) or is_hostname(value)):
+            return
+
+        # An IPv4 address settles the type on its own; reverse DNS is opt-in
+        # because PTR queries are the slowest and most likely to time out
+        if is_ipv4(value) and not self._reverse_lookup:
+            self._lookups.cancel("value")
+            self._input("#record-type").value = "A"
+            if self._info:
+                self._info.update(_IPV4_DETECTED_CUE)
             return
 
         if self._info:
             self._info.update("[yellow]⏳ Checking DNS...[/yellow]")
 
-        suggested_type, lookup_result = dns_lookup(value.strip())
+        self._lookups.run(
+            self,
+            "value",
+            partial(self._lookups.cache.get_or_call, dns_lookup, value),
+            self._apply_dns_result,
+        )
+
+    def _apply_dns_result(self, result: tuple[Literal["A", "AAAA", "CNAME"] | None, dict]) -> None:
+        suggested_type, lookup_result = result
 
         if suggested_type:
-            type_input = self.query_one("#record-type", Input)
+            type_input = self._input("#record-type")
             # Always update type field when new DNS info is found (consistent with label lookup)
             type_input.value = suggested_type
 
@@ -521,28 +868,16 @@ class RecordFormScreen(ModalScreen[RecordFormResult | None]):
     def _show_lookup_info(
         self, suggested_type: Literal["A", "AAAA", "CNAME"] | None, lookup_result: dict
     ) -> None:
-        if not self._info:
+        if not self._info or suggested_type not in _VALUE_LOOKUP_CUES:
             return
 
-        messages = []
+        result_key, found_cue, missing_cue = _VALUE_LOOKUP_CUES[suggested_type]
+        if result_key is None:
+            self._info.update(found_cue)
+            return
 
-        if suggested_type == "A":
-            hostname = lookup_result.get("hostname")
-            if hostname:
-                messages.append(f"[green]✓[/green] [cyan]Reverse DNS: {hostname}[/cyan]")
-            else:
-                messages.append("[yellow]○[/yellow] [dim]No reverse DNS found[/dim]")
-        elif suggested_type == "AAAA":
-            messages.append("[green]✓[/green] [cyan]IPv6 address detected[/cyan]")
-        elif suggested_type == "CNAME":
-            ip = lookup_result.get("ip")
-            if ip:
-                messages.append(f"[green]✓[/green] [cyan]Forward DNS: {ip}[/cyan]")
-            else:
-                messages.append("[yellow]○[/yellow] [dim]No forward DNS found[/dim]")
-
-        if messages:
-            self._info.update(" | ".join(messages))
+        answer = lookup_result.get(result_key)
+        self._info.update(found_cue.format(answer) if answer else missing_cue)
 
     def on_input_submitted(self, _event: Input.Submitted) -> None:  # pragma: no cover - shortcut
         if not self._focus_relative_input(1, wrap=False):
@@ -576,7 +911,7 @@ class RecordFormScreen(ModalScreen[RecordFormResult | None]):
 
         if not label:
             raise ValueError("Record label is required.")
-        if rtype not in ("A", "AAAA", "CNAME", "MX", "TXT", "SRV", "NS", "CAA"):
+        if rtype not in RECORD_TYPES:
             raise ValueError("Record type must be one of: A, AAAA, CNAME, MX, TXT, SRV, NS, CAA.")
         if not value:
             raise ValueError("Record value is required.")
@@ -622,12 +957,23 @@ class RecordFormScreen(ModalScreen[RecordFormResult | None]):
         )
 
     def _value(self, selector: str) -> str:
-        return self.query_one(selector, Input).value.strip()
+        return self._input(selector).value.strip()
+
+    def _input(self, selector: str) -> Input:
+        # Inputs are composed once per form, so each is queried only on first use
+        widget = self._inputs.get(selector)
+        if widget is None:
+            widget = self._inputs[selector] = self.query_one(selector, Input)
+        return widget
 
     def _show_error(self, message: str) -> None:
         if self._error:
             self._error.update(f"[red]{message}[/red]")
 
+    def _show_lookup_failure(self) -> None:
+        if self._info:
+            self._info.update(_LOOKUP_FAILED_CUE)
+
     def _focus_relative_input(self, delta: int, *, wrap: bool) -> bool:
         focused = self.app.focused
         current_id = focused.id if isinstance(focused, Input) else None
@@ -644,7 +990,7 @@ class RecordFormScreen(ModalScreen[RecordFormResult | None]):
             target %= len(self._FIELD_IDS)
 
         field_id = self._FIELD_IDS[target]
-        self.query_one(f"#{field_id}", Input).focus()
+        self._input(f"#{field_id}").focus()
         return True
 
 
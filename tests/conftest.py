@@ -0,0 +1,51 @@
+"""Shared pytest fixtures."""
+
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from tuneup_alpha.logging_config import shutdown_logging
+from tuneup_alpha.models import Record, Zone
+
+
+@pytest.fixture
+def logging_sandbox() -> Iterator[None]:
+    """Restore root logger handlers and level after a test reconfigures logging.
+
+    The background file writer is stopped and handlers installed during the
+    test are closed, so threads and file handles opened by ``setup_logging``
+    do not leak into later tests.
+    """
+    root = logging.getLogger()
+    saved_handlers = root.handlers[:]
+    saved_level = root.level
+    yield
+    shutdown_logging()
+    for handler in root.handlers:
+        if handler not in saved_handlers:
+            handler.close()
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+
+
+@pytest.fixture(scope="module")
+def base_zone() -> Zone:
+    """Return an empty example.com zone shared by every test in the module.
+
+    The instance is built once per module, so tests must treat it as
+    read-only and never mutate it or its ``records`` list.
+    """
+    return Zone(
+        name="example.com",
+        server="ns1.example.com",
+        key_file=Path("/etc/nsupdate/example.com.key"),
+        records=[],
+    )
+
+
+@pytest.fixture(scope="module")
+def apex_a_record() -> Record:
+    """Return a shared ``@ A 1.2.3.4`` record with the default TTL (records are frozen)."""
+    return Record(label="@", type="A", value="1.2.3.4")
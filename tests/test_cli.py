@@ -1,14 +1,18 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+import typer
 from typer.testing import CliRunner
 
-from tuneup_alpha.cli import app
+from tuneup_alpha.cli import _find_zone, app, tui
 from tuneup_alpha.config import ConfigRepository
-from tuneup_alpha.models import Record, Zone
+from tuneup_alpha.models import AppConfig, Record, Zone
 
 runner = CliRunner()
 
+pytestmark = pytest.mark.usefixtures("logging_sandbox")
+
 
 def test_version_command() -> None:
     result = runner.invoke(app, ["version"])
@@ -141,11 +145,22 @@ def test_apply_command_zone_not_found(tmp_path: Path) -> None:
     assert "not found" in result.stdout
 
 
+def test_find_zone_missing_exits_with_code_2(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    ConfigRepository(config_path).save(AppConfig())
+
+    with pytest.raises(typer.Exit) as excinfo:
+        _find_zone("nonexistent.com", config_path)
+    assert excinfo.value.exit_code == 2
+
+
 @patch("tuneup_alpha.cli.run_dashboard")
 def test_tui_command(mock_run_dashboard: MagicMock, tmp_path: Path) -> None:
     config_path = tmp_path / "config.yaml"
     ConfigRepository(config_path).save(ConfigRepository(config_path).load())
 
-    result = runner.invoke(app, ["tui", "--config-path", str(config_path)])
-    assert result.exit_code == 0
+    # Nothing is printed, so the command is called directly rather than through CliRunner
+    tui(config_path=config_path)
+
     mock_run_dashboard.assert_called_once()
+    assert mock_run_dashboard.call_args.args[0].path == config_path
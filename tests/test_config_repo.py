@@ -1,9 +1,19 @@
+import json
+import os
+import shutil
 from pathlib import Path
 
 import pytest
+from pydantic import create_model
 
-from tuneup_alpha.config import ConfigError, ConfigRepository, sample_config
-from tuneup_alpha.models import AppConfig, Zone
+from tuneup_alpha.config import (
+    _SNAPSHOT_VERSION,
+    ConfigError,
+    ConfigRepository,
+    _schema_version,
+    sample_config,
+)
+from tuneup_alpha.models import AppConfig, Record, Zone
 
 
 def test_load_missing_returns_empty(tmp_path: Path) -> None:
@@ -128,3 +138,126 @@ def test_config_default_prefix_key_path(tmp_path: Path) -> None:
 
     loaded = repo.load()
     assert loaded.prefix_key_path == "~/.config/nsupdate"
+
+
+def test_sample_config_returns_independent_copies() -> None:
+    first = sample_config()
+    first.zones[0].records.clear()
+    first.zones[0].name = "changed.example"
+
+    second = sample_config()
+    assert second.zones[0].name == "example.com"
+    assert len(second.zones[0].records) == 3
+
+
+def test_ensure_sample_matches_sample_config(tmp_path: Path) -> None:
+    repo = ConfigRepository(tmp_path / "nested" / "config.yaml")
+    repo.ensure_sample()
+
+    assert repo.load() == sample_config()
+
+
+def test_repository_accepts_string_path(tmp_path: Path) -> None:
+    target = tmp_path / "config.yaml"
+    repo = ConfigRepository(str(target))
+    assert repo.path == target
+    assert isinstance(repo.path, Path)
+
+
+def test_repository_keeps_path_instance(tmp_path: Path) -> None:
+    target = tmp_path / "config.yaml"
+    repo = ConfigRepository(target)
+    assert repo.path is target
+
+
+def test_failed_mutation_leaves_file_untouched(tmp_path: Path) -> None:
+    target = tmp_path / "config.yaml"
+    repo = ConfigRepository(target)
+    repo.save(sample_config())
+    before = target.read_text()
+
+    with pytest.raises(ConfigError):
+        repo.delete_zone("not-there")
+    assert target.read_text() == before
+
+
+def test_failed_mutation_does_not_create_file(tmp_path: Path) -> None:
+    target = tmp_path / "config.yaml"
+    repo = ConfigRepository(target)
+
+    with pytest.raises(ConfigError):
+        repo.update_zone("not-there", sample_config().zones[0])
+    assert not target.exists()
+
+
+def test_save_writes_json_snapshot(tmp_path: Path) -> None:
+    repo = ConfigRepository(tmp_path / "config.yaml")
+    repo.save(sample_config())
+
+    assert repo.cache_path == tmp_path / "config.yaml.cache.json"
+    assert repo.cache_path.exists()
+    assert repo.load() == sample_config()
+
+
+def test_hand_edited_yaml_wins_over_snapshot(tmp_path: Path) -> None:
+    target = tmp_path / "config.yaml"
+    repo = ConfigRepository(target)
+    repo.save(sample_config())
+
+    target.write_text("zones: []\n")
+    cache_mtime = repo.cache_path.stat().st_mtime_ns
+    os.utime(target, ns=(cache_mtime + 1_000_000, cache_mtime + 1_000_000))
+
+    assert repo.load().zones == []
+
+
+def test_restored_yaml_with_older_mtime_wins_over_snapshot(tmp_path: Path) -> None:
+    target = tmp_path / "config.yaml"
+    repo = ConfigRepository(target)
+    repo.save(sample_config())
+    backup = tmp_path / "config.yaml.bak"
+    shutil.copy2(target, backup)
+
+    repo.delete_zone("example.com")
+    # Restoring with copy2 (like cp -p or rsync -a) keeps the backup's older mtime
+    shutil.copy2(backup, target)
+
+    assert target.stat().st_mtime_ns < repo.cache_path.stat().st_mtime_ns
+    assert repo.load().zones[0].name == "example.com"
+
+
+def test_corrupt_snapshot_falls_back_to_yaml(tmp_path: Path) -> None:
+    repo = ConfigRepository(tmp_path / "config.yaml")
+    repo.save(sample_config())
+    repo.cache_path.write_text("{not json")
+
+    assert repo.load().zones[0].name == "example.com"
+
+
+def test_snapshot_load_restores_nested_models(tmp_path: Path) -> None:
+    repo = ConfigRepository(tmp_path / "config.yaml")
+    config = sample_config()
+    config.logging.log_file = tmp_path / "app.log"
+    repo.save(config)
+
+    loaded = repo.load()
+    assert loaded == config
+    assert isinstance(loaded.zones[0].key_file, Path)
+    assert isinstance(loaded.zones[0].records[0], Record)
+    assert loaded.logging.log_file == tmp_path / "app.log"
+
+
+def test_snapshot_version_follows_model_schema() -> None:
+    # Same model name, one more field: a stand-in for adding an option to AppConfig
+    extended = create_model("AppConfig", __base__=AppConfig, extra_option=(bool, False))
+
+    assert _schema_version(AppConfig) == _SNAPSHOT_VERSION
+    assert _schema_version(extended) != _SNAPSHOT_VERSION
+
+
+def test_snapshot_with_other_version_is_ignored(tmp_path: Path) -> None:
+    repo = ConfigRepository(tmp_path / "config.yaml")
+    repo.save(sample_config())
+    repo.cache_path.write_text(json.dumps({"version": -1, "config": {"zones": []}}))
+
+    assert repo.load().zones[0].name == "example.com"
@@ -1,12 +1,20 @@
 """Tests for DNS lookup utilities."""
 
-from unittest.mock import MagicMock, patch
+import socket
+import subprocess
+import threading
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import patch
+
+import pytest
 
 from tuneup_alpha.dns_lookup import (
     dig_lookup,
     dns_lookup,
     dns_lookup_label,
     forward_dns_lookup,
+    is_hostname,
     is_ipv4,
     lookup_a_records,
     lookup_aaaa_records,
@@ -20,6 +28,24 @@ from tuneup_alpha.dns_lookup import (
 )
 
 
+def _raise(exc: BaseException) -> Callable[..., Any]:
+    """Return a stand-in callable that raises ``exc`` when invoked."""
+
+    def fake(*args: Any, **kwargs: Any) -> Any:
+        raise exc
+
+    return fake
+
+
+def _completed(stdout: str, returncode: int = 0) -> Callable[..., Any]:
+    """Return a stand-in for subprocess.run producing a fixed result."""
+
+    def fake(args: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        return subprocess.CompletedProcess(args, returncode, stdout=stdout, stderr="")
+
+    return fake
+
+
 def test_is_ipv4_valid():
     """Test is_ipv4 with valid IPv4 addresses."""
     assert is_ipv4("192.168.1.1") is True
@@ -37,73 +63,100 @@ def test_is_ipv4_invalid():
     assert is_ipv4("not-an-ip") is False
     assert is_ipv4("") is False
     assert is_ipv4("abc.def.ghi.jkl") is False
+    assert is_ipv4("0x1.2.3.4") is False  # Hex octet
+    assert is_ipv4("1.2.3.4 junk") is False  # Trailing garbage
+    assert is_ipv4("1.2.3.4\n") is False
+
+
+def test_is_hostname():
+    """Test is_hostname with host names and values that cannot be resolved."""
+    assert is_hostname("www") is True
+    assert is_hostname("mail.example.com") is True
+    assert is_hostname("mail.example.com.") is True
+    assert is_hostname("xn--bcher-kva.example") is True
+    assert is_hostname("_dmarc.example.com") is True
+    assert is_hostname("_sip._tcp.example.com") is True
+    assert is_hostname("") is False
+    assert is_hostname("example..com") is False
+    assert is_hostname("-bad.example.com") is False
+    assert is_hostname("10 mail.example.com") is False  # MX value
+    assert is_hostname('0 issue "letsencrypt.org"') is False  # CAA value
+    assert is_hostname("a" * 64 + ".example.com") is False  # Label too long
+
+
+def test_reverse_dns_lookup_success(monkeypatch: pytest.MonkeyPatch):
+    """Test reverse DNS lookup with successful resolution."""
+    calls: list[str] = []
 
+    def fake_gethostbyaddr(ip: str) -> tuple[str, list[str], list[str]]:
+        calls.append(ip)
+        return ("example.com.", [], ["8.8.8.8"])
 
-def test_reverse_dns_lookup_success():
-    """Test reverse DNS lookup with successful resolution."""
-    # Mock the socket.gethostbyaddr function
-    with patch("tuneup_alpha.dns_lookup.socket.gethostbyaddr") as mock_lookup:
-        mock_lookup.return_value = ("example.com.", [], ["8.8.8.8"])
-        result = reverse_dns_lookup("8.8.8.8")
-        assert result["hostname"] == "example.com"
-        mock_lookup.assert_called_once_with("8.8.8.8")
+    monkeypatch.setattr(socket, "gethostbyaddr", fake_gethostbyaddr)
+    result = reverse_dns_lookup("8.8.8.8")
+    assert result["hostname"] == "example.com"
+    assert calls == ["8.8.8.8"]
 
 
-def test_reverse_dns_lookup_failure():
+def test_reverse_dns_lookup_failure(monkeypatch: pytest.MonkeyPatch):
     """Test reverse DNS lookup with failed resolution."""
-    import socket
-
-    with patch("tuneup_alpha.dns_lookup.socket.gethostbyaddr") as mock_lookup:
-        mock_lookup.side_effect = socket.herror("Host not found")
-        result = reverse_dns_lookup("192.0.2.1")
-        assert result["hostname"] is None
+    monkeypatch.setattr(socket, "gethostbyaddr", _raise(socket.herror("Host not found")))
+    result = reverse_dns_lookup("192.0.2.1")
+    assert result["hostname"] is None
 
 
-def test_forward_dns_lookup_success():
+def test_forward_dns_lookup_success(monkeypatch: pytest.MonkeyPatch):
     """Test forward DNS lookup with successful resolution."""
-    with patch("tuneup_alpha.dns_lookup.socket.gethostbyname") as mock_lookup:
-        mock_lookup.return_value = "93.184.216.34"
-        result = forward_dns_lookup("example.com")
-        assert result["ip"] == "93.184.216.34"
-        mock_lookup.assert_called_once_with("example.com")
+    calls: list[str] = []
+
+    def fake_gethostbyname(hostname: str) -> str:
+        calls.append(hostname)
+        return "93.184.216.34"
 
+    monkeypatch.setattr(socket, "gethostbyname", fake_gethostbyname)
+    result = forward_dns_lookup("example.com")
+    assert result["ip"] == "93.184.216.34"
+    assert calls == ["example.com"]
 
-def test_forward_dns_lookup_with_trailing_dot():
+
+def test_forward_dns_lookup_with_trailing_dot(monkeypatch: pytest.MonkeyPatch):
     """Test forward DNS lookup strips trailing dot."""
-    with patch("tuneup_alpha.dns_lookup.socket.gethostbyname") as mock_lookup:
-        mock_lookup.return_value = "93.184.216.34"
-        result = forward_dns_lookup("example.com.")
-        assert result["ip"] == "93.184.216.34"
-        # Should strip the trailing dot before lookup
-        mock_lookup.assert_called_once_with("example.com")
+    calls: list[str] = []
 
+    def fake_gethostbyname(hostname: str) -> str:
+        calls.append(hostname)
+        return "93.184.216.34"
 
-def test_forward_dns_lookup_failure():
-    """Test forward DNS lookup with failed resolution."""
-    import socket
+    monkeypatch.setattr(socket, "gethostbyname", fake_gethostbyname)
+    result = forward_dns_lookup("example.com.")
+    assert result["ip"] == "93.184.216.34"
+    # Should strip the trailing dot before lookup
+    assert calls == ["example.com"]
 
-    with patch("tuneup_alpha.dns_lookup.socket.gethostbyname") as mock_lookup:
-        mock_lookup.side_effect = socket.gaierror("Name or service not known")
-        result = forward_dns_lookup("nonexistent.invalid")
-        assert result["ip"] is None
+
+def test_forward_dns_lookup_failure(monkeypatch: pytest.MonkeyPatch):
+    """Test forward DNS lookup with failed resolution."""
+    monkeypatch.setattr(
+        socket, "gethostbyname", _raise(socket.gaierror("Name or service not known"))
+    )
+    result = forward_dns_lookup("nonexistent.invalid")
+    assert result["ip"] is None
 
 
-def test_dns_lookup_with_ipv4():
+def test_dns_lookup_with_ipv4(monkeypatch: pytest.MonkeyPatch):
     """Test dns_lookup with IPv4 address."""
-    with patch("tuneup_alpha.dns_lookup.socket.gethostbyaddr") as mock_lookup:
-        mock_lookup.return_value = ("dns.google.", [], ["8.8.8.8"])
-        suggested_type, result = dns_lookup("8.8.8.8")
-        assert suggested_type == "A"
-        assert result["hostname"] == "dns.google"
+    monkeypatch.setattr(socket, "gethostbyaddr", lambda ip: ("dns.google.", [], ["8.8.8.8"]))
+    suggested_type, result = dns_lookup("8.8.8.8")
+    assert suggested_type == "A"
+    assert result["hostname"] == "dns.google"
 
 
-def test_dns_lookup_with_hostname():
+def test_dns_lookup_with_hostname(monkeypatch: pytest.MonkeyPatch):
     """Test dns_lookup with hostname."""
-    with patch("tuneup_alpha.dns_lookup.socket.gethostbyname") as mock_lookup:
-        mock_lookup.return_value = "93.184.216.34"
-        suggested_type, result = dns_lookup("example.com")
-        assert suggested_type == "CNAME"
-        assert result["ip"] == "93.184.216.34"
+    monkeypatch.setattr(socket, "gethostbyname", lambda hostname: "93.184.216.34")
+    suggested_type, result = dns_lookup("example.com")
+    assert suggested_type == "CNAME"
+    assert result["ip"] == "93.184.216.34"
 
 
 def test_dns_lookup_with_empty_string():
@@ -120,70 +173,92 @@ def test_dns_lookup_with_apex():
     assert result == {}
 
 
-def test_dns_lookup_ipv4_no_reverse():
+def test_dns_lookup_ipv4_no_reverse(monkeypatch: pytest.MonkeyPatch):
     """Test dns_lookup with IPv4 that has no reverse DNS."""
-    import socket
+    calls: list[str] = []
 
-    with patch("tuneup_alpha.dns_lookup.socket.gethostbyaddr") as mock_lookup:
-        mock_lookup.side_effect = socket.herror("Host not found")
-        suggested_type, result = dns_lookup("192.0.2.1")
-        assert suggested_type == "A"
-        assert result["hostname"] is None
+    def gethostbyaddr(ip: str) -> tuple[str, list[str], list[str]]:
+        calls.append(ip)
+        raise socket.herror("Host not found")
 
+    monkeypatch.setattr(socket, "gethostbyaddr", gethostbyaddr)
+    suggested_type, result = dns_lookup("8.8.4.4")
+    assert suggested_type == "A"
+    assert result["hostname"] is None
+    assert calls == ["8.8.4.4"]
+
+
+@pytest.mark.parametrize("ip", ["192.0.2.1", "203.0.113.7", "127.0.0.1", "169.254.0.1"])
+def test_dns_lookup_skips_reverse_for_non_routable_ipv4(monkeypatch: pytest.MonkeyPatch, ip: str):
+    """Test dns_lookup does not query PTR records for documentation or local addresses."""
+    monkeypatch.setattr(socket, "gethostbyaddr", _raise(AssertionError("unexpected lookup")))
+    suggested_type, result = dns_lookup(ip)
+    assert suggested_type == "A"
+    assert result["hostname"] is None
 
-def test_dns_lookup_hostname_no_forward():
-    """Test dns_lookup with hostname that has no forward DNS."""
-    import socket
 
-    with patch("tuneup_alpha.dns_lookup.socket.gethostbyname") as mock_lookup:
-        mock_lookup.side_effect = socket.gaierror("Name or service not known")
-        suggested_type, result = dns_lookup("nonexistent.invalid")
-        assert suggested_type == "CNAME"
-        assert result["ip"] is None
+def test_dns_lookup_reverse_for_private_ipv4(monkeypatch: pytest.MonkeyPatch):
+    """Test dns_lookup still queries PTR records for RFC 1918 addresses."""
+    monkeypatch.setattr(socket, "gethostbyaddr", lambda ip: ("gw.internal.", [], [ip]))
+    suggested_type, result = dns_lookup("10.0.0.1")
+    assert suggested_type == "A"
+    assert result["hostname"] == "gw.internal"
 
 
-def test_dig_lookup_success():
+def test_dns_lookup_hostname_no_forward(monkeypatch: pytest.MonkeyPatch):
+    """Test dns_lookup with hostname that has no forward DNS."""
+    monkeypatch.setattr(
+        socket, "gethostbyname", _raise(socket.gaierror("Name or service not known"))
+    )
+    suggested_type, result = dns_lookup("nonexistent.invalid")
+    assert suggested_type == "CNAME"
+    assert result["ip"] is None
+
+
+def test_dig_lookup_success(monkeypatch: pytest.MonkeyPatch):
     """Test dig_lookup with successful response."""
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    mock_result.stdout = "ns1.example.com.\nns2.example.com.\n"
+    monkeypatch.setattr(
+        subprocess, "run", _completed(stdout="ns1.example.com.\nns2.example.com.\n")
+    )
+    result = dig_lookup("example.com", "NS")
+    assert result == ["ns1.example.com", "ns2.example.com"]
 
-    with patch("tuneup_alpha.dns_lookup.subprocess.run", return_value=mock_result):
-        result = dig_lookup("example.com", "NS")
-        assert result == ["ns1.example.com", "ns2.example.com"]
 
+def test_dig_lookup_bounds_query_time(monkeypatch: pytest.MonkeyPatch):
+    """Test dig_lookup caps dig's own retries below the subprocess timeout."""
+    seen: dict[str, Any] = {}
 
-def test_dig_lookup_empty_result():
-    """Test dig_lookup with no results."""
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    mock_result.stdout = ""
+    def fake_run(args: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        seen["args"], seen["timeout"] = args, kwargs["timeout"]
+        return subprocess.CompletedProcess(args, 0, stdout="", stderr="")
 
-    with patch("tuneup_alpha.dns_lookup.subprocess.run", return_value=mock_result):
-        result = dig_lookup("example.com", "NS")
-        assert result == []
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    dig_lookup("example.com", "NS")
 
+    assert seen["args"] == ["dig", "+short", "+time=2", "+tries=2", "example.com", "NS"]
+    # Two tries of two seconds finish before the process would be killed
+    assert seen["timeout"] > 2 * 2
 
-def test_dig_lookup_failure():
-    """Test dig_lookup with failed command."""
-    mock_result = MagicMock()
-    mock_result.returncode = 1
 
-    with patch("tuneup_alpha.dns_lookup.subprocess.run", return_value=mock_result):
-        result = dig_lookup("example.com", "NS")
-        assert result == []
+def test_dig_lookup_empty_result(monkeypatch: pytest.MonkeyPatch):
+    """Test dig_lookup with no results."""
+    monkeypatch.setattr(subprocess, "run", _completed(stdout=""))
+    result = dig_lookup("example.com", "NS")
+    assert result == []
 
 
-def test_dig_lookup_timeout():
-    """Test dig_lookup with timeout."""
-    import subprocess
+def test_dig_lookup_failure(monkeypatch: pytest.MonkeyPatch):
+    """Test dig_lookup with failed command."""
+    monkeypatch.setattr(subprocess, "run", _completed(stdout="", returncode=1))
+    result = dig_lookup("example.com", "NS")
+    assert result == []
 
-    with patch(
-        "tuneup_alpha.dns_lookup.subprocess.run",
-        side_effect=subprocess.TimeoutExpired("dig", 5),
-    ):
-        result = dig_lookup("example.com", "NS")
-        assert result == []
+
+def test_dig_lookup_timeout(monkeypatch: pytest.MonkeyPatch):
+    """Test dig_lookup with timeout."""
+    monkeypatch.setattr(subprocess, "run", _raise(subprocess.TimeoutExpired("dig", 5)))
+    result = dig_lookup("example.com", "NS")
+    assert result == []
 
 
 def test_lookup_nameservers():
@@ -215,8 +290,14 @@ def test_lookup_cname_records():
 
 def test_dns_lookup_label_with_cname():
     """Test dns_lookup_label finding a CNAME record."""
-    with patch("tuneup_alpha.dns_lookup.lookup_cname_records") as mock_cname:
+    with (
+        patch("tuneup_alpha.dns_lookup.lookup_cname_records") as mock_cname,
+        patch("tuneup_alpha.dns_lookup.lookup_a_records") as mock_a,
+        patch("tuneup_alpha.dns_lookup.lookup_aaaa_records") as mock_aaaa,
+    ):
         mock_cname.return_value = ["target.example.com"]
+        mock_a.return_value = ["192.0.2.1"]
+        mock_aaaa.return_value = []
         record_type, value = dns_lookup_label("www", "example.com")
         assert record_type == "CNAME"
         assert value == "target.example.com"
@@ -228,9 +309,11 @@ def test_dns_lookup_label_with_a_record():
     with (
         patch("tuneup_alpha.dns_lookup.lookup_cname_records") as mock_cname,
         patch("tuneup_alpha.dns_lookup.lookup_a_records") as mock_a,
+        patch("tuneup_alpha.dns_lookup.lookup_aaaa_records") as mock_aaaa,
     ):
         mock_cname.return_value = []
         mock_a.return_value = ["192.0.2.1"]
+        mock_aaaa.return_value = ["2001:db8::1"]
         record_type, value = dns_lookup_label("www", "example.com")
         assert record_type == "A"
         assert value == "192.0.2.1"
@@ -241,9 +324,11 @@ def test_dns_lookup_label_apex():
     with (
         patch("tuneup_alpha.dns_lookup.lookup_cname_records") as mock_cname,
         patch("tuneup_alpha.dns_lookup.lookup_a_records") as mock_a,
+        patch("tuneup_alpha.dns_lookup.lookup_aaaa_records") as mock_aaaa,
     ):
         mock_cname.return_value = []
         mock_a.return_value = ["192.0.2.1"]
+        mock_aaaa.return_value = []
         record_type, value = dns_lookup_label("@", "example.com")
         assert record_type == "A"
         assert value == "192.0.2.1"
@@ -266,6 +351,25 @@ def test_dns_lookup_label_not_found():
         assert value is None
 
 
+def test_dns_lookup_label_queries_types_concurrently(monkeypatch: pytest.MonkeyPatch):
+    """Test dns_lookup_label has the CNAME, A and AAAA queries in flight together."""
+    # Each lookup waits for the other two; run one after another they would time out
+    all_started = threading.Barrier(3, timeout=5)
+
+    def fake_lookup(records: list[str]) -> Callable[[str], list[str]]:
+        def lookup(domain: str) -> list[str]:
+            all_started.wait()
+            return records
+
+        return lookup
+
+    monkeypatch.setattr("tuneup_alpha.dns_lookup.lookup_cname_records", fake_lookup([]))
+    monkeypatch.setattr("tuneup_alpha.dns_lookup.lookup_a_records", fake_lookup([]))
+    monkeypatch.setattr("tuneup_alpha.dns_lookup.lookup_aaaa_records", fake_lookup(["2001:db8::1"]))
+
+    assert dns_lookup_label("www", "example.com") == ("AAAA", "2001:db8::1")
+
+
 def test_dns_lookup_label_empty_inputs():
     """Test dns_lookup_label with empty inputs."""
     record_type, value = dns_lookup_label("", "example.com")
@@ -286,6 +390,7 @@ def test_is_ipv6_valid():
     assert is_ipv6("::1") is True
     assert is_ipv6("fe80::1") is True
     assert is_ipv6("::ffff:192.0.2.1") is True
+    assert is_ipv6("fe80::1%eth0") is True  # Scoped link-local
 
 
 def test_is_ipv6_invalid():
@@ -296,6 +401,9 @@ def test_is_ipv6_invalid():
     assert is_ipv6("example.com") is False
     assert is_ipv6("not-an-ipv6") is False
     assert is_ipv6("") is False
+    assert is_ipv6("2001:db8::1::2") is False  # Two "::" groups
+    assert is_ipv6("2001:db8::g") is False
+    assert is_ipv6("1:2:3:4:5:6:7:8:9") is False
 
 
 def test_dns_lookup_with_ipv6():
@@ -466,3 +574,11 @@ def test_dns_lookup_label_with_type_unsupported_type():
 
     value = dns_lookup_label_with_type("www", "example.com", "UNSUPPORTED")
     assert value is None
+
+
+def test_is_ipv4_rejects_non_digit_input_without_parsing(monkeypatch: pytest.MonkeyPatch):
+    """Test is_ipv4 short-circuits hostnames before calling inet_pton."""
+    monkeypatch.setattr(socket, "inet_pton", _raise(AssertionError("inet_pton called")))
+    assert is_ipv4("mail.example.com") is False
+    assert is_ipv4("1.2.3.4a") is False
+    assert is_ipv4("") is False
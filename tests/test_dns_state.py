@@ -1,15 +1,19 @@
 """Tests for DNS state validation module."""
 
+from collections.abc import Callable
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from tuneup_alpha.dns_state import (
+    DigCache,
     DNSStateDiff,
     compare_dns_state,
     query_current_dns_state,
     validate_dns_state,
 )
-from tuneup_alpha.models import Record, Zone
+from tuneup_alpha.models import Record, RecordChange, Zone
 
 
 def _zone() -> Zone:
@@ -22,55 +26,57 @@ def _zone() -> Zone:
     )
 
 
-def test_dns_state_diff_has_changes_empty() -> None:
-    """Test has_changes returns False when there are no changes."""
-    diff = DNSStateDiff(
-        zone_name="example.com",
-        changes=[],
-        current_records=[],
-        desired_records=[],
-    )
-    assert not diff.has_changes()
-
+def _dig_mock(table: dict[tuple[str, str], list[str]]) -> Callable[[str, str], list[str]]:
+    """Build a dig_lookup stand-in answering from a (domain, type) table."""
+    return lambda domain, record_type: table.get((domain, record_type), [])
 
-def test_dns_state_diff_has_changes_with_changes() -> None:
-    """Test has_changes returns True when there are changes."""
-    from tuneup_alpha.models import RecordChange
 
-    record = Record(label="@", type="A", value="1.2.3.4")
-    diff = DNSStateDiff(
-        zone_name="example.com",
-        changes=[RecordChange(action="create", record=record)],
-        current_records=[],
-        desired_records=[record],
+@pytest.fixture(scope="module")
+def sample_records() -> tuple[Record, ...]:
+    """Records shared by the DNSStateDiff tests; never mutated."""
+    return (
+        Record(label="@", type="A", value="1.2.3.4"),
+        Record(label="www", type="CNAME", value="@"),
+        Record(label="old", type="A", value="5.6.7.8"),
+        Record(label="change", type="A", value="9.9.9.9"),
     )
-    assert diff.has_changes()
 
 
-def test_dns_state_diff_summary() -> None:
-    """Test summary returns correct counts."""
-    from tuneup_alpha.models import RecordChange
-
-    record1 = Record(label="@", type="A", value="1.2.3.4")
-    record2 = Record(label="www", type="CNAME", value="@")
-    record3 = Record(label="old", type="A", value="5.6.7.8")
-    record4 = Record(label="change", type="A", value="9.9.9.9")
-
+@pytest.mark.parametrize(
+    ("actions", "expected"),
+    [
+        pytest.param([], {"create": 0, "delete": 0, "update": 0}, id="empty"),
+        pytest.param([("create", 0)], {"create": 1, "delete": 0, "update": 0}, id="single"),
+        pytest.param(
+            [("create", 0), ("create", 1), ("delete", 2), ("update", 3)],
+            {"create": 2, "delete": 1, "update": 1},
+            id="mixed",
+        ),
+    ],
+)
+def test_dns_state_diff_summary(
+    sample_records: tuple[Record, ...],
+    actions: list[tuple[str, int]],
+    expected: dict[str, int],
+) -> None:
+    """Test has_changes and summary reflect the recorded changes."""
+    changes = [
+        RecordChange(
+            action=action,
+            record=sample_records[index],
+            previous=sample_records[2] if action == "update" else None,
+        )
+        for action, index in actions
+    ]
     diff = DNSStateDiff(
         zone_name="example.com",
-        changes=[
-            RecordChange(action="create", record=record1),
-            RecordChange(action="create", record=record2),
-            RecordChange(action="delete", record=record3),
-            RecordChange(action="update", record=record4, previous=record3),
-        ],
+        changes=changes,
         current_records=[],
-        desired_records=[record1, record2, record4],
+        desired_records=[change.record for change in changes if change.action != "delete"],
     )
-    summary = diff.summary()
-    assert summary["create"] == 2
-    assert summary["delete"] == 1
-    assert summary["update"] == 1
+
+    assert diff.has_changes() is bool(changes)
+    assert diff.summary() == expected
 
 
 @patch("tuneup_alpha.dns_state.dig_lookup")
@@ -90,12 +96,7 @@ def test_query_current_dns_state_with_a_record(mock_dig: any) -> None:
     """Test querying DNS state with A record."""
 
     # Mock dig_lookup to return an A record for the apex
-    def mock_lookup(domain: str, record_type: str) -> list[str]:
-        if domain == "example.com" and record_type == "A":
-            return ["1.2.3.4"]
-        return []
-
-    mock_dig.side_effect = mock_lookup
+    mock_dig.side_effect = _dig_mock({("example.com", "A"): ["1.2.3.4"]})
 
     zone = _zone()
     zone.records = [Record(label="@", type="A", value="1.2.3.4")]
@@ -104,43 +105,34 @@ def test_query_current_dns_state_with_a_record(mock_dig: any) -> None:
 
     # Should find at least the A record
     assert len(result) >= 1
-    a_records = [r for r in result if r.type == "A" and r.value == "1.2.3.4"]
-    assert len(a_records) == 1
-    assert a_records[0].label == "@"
+    # Unpacking the generator asserts exactly one match without building a list
+    (a_record,) = (r for r in result if r.type == "A" and r.value == "1.2.3.4")
+    assert a_record.label == "@"
 
 
 @patch("tuneup_alpha.dns_state.dig_lookup")
 def test_query_current_dns_state_with_mx_record(mock_dig: any) -> None:
     """Test querying DNS state with MX record."""
 
-    def mock_lookup(domain: str, record_type: str) -> list[str]:
-        if domain == "example.com" and record_type == "MX":
-            return ["10 mail.example.com"]
-        return []
-
-    mock_dig.side_effect = mock_lookup
+    mock_dig.side_effect = _dig_mock({("example.com", "MX"): ["10 mail.example.com"]})
 
     zone = _zone()
     zone.records = [Record(label="@", type="MX", value="mail.example.com", priority=10)]
 
     result = query_current_dns_state(zone)
 
-    mx_records = [r for r in result if r.type == "MX"]
-    assert len(mx_records) == 1
-    assert mx_records[0].value == "mail.example.com"
-    assert mx_records[0].priority == 10
+    (mx_record,) = (r for r in result if r.type == "MX")
+    assert mx_record.value == "mail.example.com"
+    assert mx_record.priority == 10
 
 
 @patch("tuneup_alpha.dns_state.dig_lookup")
 def test_query_current_dns_state_with_srv_record(mock_dig: any) -> None:
     """Test querying DNS state with SRV record."""
 
-    def mock_lookup(domain: str, record_type: str) -> list[str]:
-        if domain == "_http._tcp.example.com" and record_type == "SRV":
-            return ["10 60 80 server.example.com"]
-        return []
-
-    mock_dig.side_effect = mock_lookup
+    mock_dig.side_effect = _dig_mock(
+        {("_http._tcp.example.com", "SRV"): ["10 60 80 server.example.com"]}
+    )
 
     zone = _zone()
     zone.records = [
@@ -156,24 +148,18 @@ def test_query_current_dns_state_with_srv_record(mock_dig: any) -> None:
 
     result = query_current_dns_state(zone)
 
-    srv_records = [r for r in result if r.type == "SRV"]
-    assert len(srv_records) == 1
-    assert srv_records[0].value == "server.example.com"
-    assert srv_records[0].priority == 10
-    assert srv_records[0].weight == 60
-    assert srv_records[0].port == 80
+    (srv_record,) = (r for r in result if r.type == "SRV")
+    assert srv_record.value == "server.example.com"
+    assert srv_record.priority == 10
+    assert srv_record.weight == 60
+    assert srv_record.port == 80
 
 
 @patch("tuneup_alpha.dns_state.dig_lookup")
 def test_compare_dns_state_no_changes(mock_dig: any) -> None:
     """Test comparing DNS state when current matches desired."""
 
-    def mock_lookup(domain: str, record_type: str) -> list[str]:
-        if domain == "example.com" and record_type == "A":
-            return ["1.2.3.4"]
-        return []
-
-    mock_dig.side_effect = mock_lookup
+    mock_dig.side_effect = _dig_mock({("example.com", "A"): ["1.2.3.4"]})
 
     zone = _zone()
     zone.records = [Record(label="@", type="A", value="1.2.3.4")]
@@ -205,12 +191,7 @@ def test_compare_dns_state_record_to_create(mock_dig: any) -> None:
 def test_compare_dns_state_record_to_delete(mock_dig: any) -> None:
     """Test comparing DNS state when a record needs to be deleted."""
 
-    def mock_lookup(domain: str, record_type: str) -> list[str]:
-        if domain == "example.com" and record_type == "A":
-            return ["1.2.3.4"]
-        return []
-
-    mock_dig.side_effect = mock_lookup
+    mock_dig.side_effect = _dig_mock({("example.com", "A"): ["1.2.3.4"]})
 
     zone = _zone()
     zone.records = []  # No desired records
@@ -228,12 +209,7 @@ def test_compare_dns_state_record_to_delete(mock_dig: any) -> None:
 def test_compare_dns_state_record_to_update(mock_dig: any) -> None:
     """Test comparing DNS state when a record needs to be updated."""
 
-    def mock_lookup(domain: str, record_type: str) -> list[str]:
-        if domain == "example.com" and record_type == "MX":
-            return ["10 mail.example.com"]
-        return []
-
-    mock_dig.side_effect = mock_lookup
+    mock_dig.side_effect = _dig_mock({("example.com", "MX"): ["10 mail.example.com"]})
 
     zone = _zone()
     # Desired has different priority
@@ -253,12 +229,7 @@ def test_compare_dns_state_record_to_update(mock_dig: any) -> None:
 def test_validate_dns_state_valid(mock_dig: any) -> None:
     """Test validating DNS state when everything matches."""
 
-    def mock_lookup(domain: str, record_type: str) -> list[str]:
-        if domain == "example.com" and record_type == "A":
-            return ["1.2.3.4"]
-        return []
-
-    mock_dig.side_effect = mock_lookup
+    mock_dig.side_effect = _dig_mock({("example.com", "A"): ["1.2.3.4"]})
 
     zone = _zone()
     zone.records = [Record(label="@", type="A", value="1.2.3.4")]
@@ -288,14 +259,12 @@ def test_validate_dns_state_invalid(mock_dig: any) -> None:
 def test_compare_dns_state_multiple_records(mock_dig: any) -> None:
     """Test comparing DNS state with multiple records."""
 
-    def mock_lookup(domain: str, record_type: str) -> list[str]:
-        if domain == "example.com" and record_type == "A":
-            return ["1.2.3.4"]
-        if domain == "www.example.com" and record_type == "CNAME":
-            return ["example.com"]
-        return []
-
-    mock_dig.side_effect = mock_lookup
+    mock_dig.side_effect = _dig_mock(
+        {
+            ("example.com", "A"): ["1.2.3.4"],
+            ("www.example.com", "CNAME"): ["example.com"],
+        }
+    )
 
     zone = _zone()
     zone.records = [
@@ -317,18 +286,81 @@ def test_compare_dns_state_multiple_records(mock_dig: any) -> None:
 def test_query_current_dns_state_with_txt_record(mock_dig: any) -> None:
     """Test querying DNS state with TXT record (quotes should be removed)."""
 
+    mock_dig.side_effect = _dig_mock(
+        {("example.com", "TXT"): ['"v=spf1 include:_spf.example.com ~all"']}
+    )
+
+    zone = _zone()
+    zone.records = [Record(label="@", type="TXT", value="v=spf1 include:_spf.example.com ~all")]
+
+    result = query_current_dns_state(zone)
+
+    (txt_record,) = (r for r in result if r.type == "TXT")
+    assert txt_record.value == "v=spf1 include:_spf.example.com ~all"
+
+
+@patch("tuneup_alpha.dns_state.dig_lookup")
+def test_query_current_dns_state_probes_each_name_and_type_once(mock_dig: any) -> None:
+    """Test every label/type pair is queried exactly once, in any order."""
+
     def mock_lookup(domain: str, record_type: str) -> list[str]:
-        if domain == "example.com" and record_type == "TXT":
-            return ['"v=spf1 include:_spf.example.com ~all"']
+        if record_type == "NS":
+            raise RuntimeError("resolver failure")
         return []
 
     mock_dig.side_effect = mock_lookup
 
     zone = _zone()
-    zone.records = [Record(label="@", type="TXT", value="v=spf1 include:_spf.example.com ~all")]
+    zone.records = [Record(label="www", type="CNAME", value="example.com")]
 
     result = query_current_dns_state(zone)
 
-    txt_records = [r for r in result if r.type == "TXT"]
-    assert len(txt_records) == 1
-    assert txt_records[0].value == "v=spf1 include:_spf.example.com ~all"
+    assert result == []
+    calls = [c.args for c in mock_dig.call_args_list]
+    assert len(calls) == len(set(calls)) == 16
+    assert {domain for domain, _ in calls} == {"example.com", "www.example.com"}
+
+
+@patch("tuneup_alpha.dns_state.dig_lookup")
+def test_shared_dig_cache_reuses_lookups_across_runs(mock_dig: any) -> None:
+    """Test compare and validate reuse lookups when given the same cache."""
+
+    mock_dig.side_effect = _dig_mock({("example.com", "A"): ["1.2.3.4"]})
+
+    zone = _zone()
+    zone.records = [Record(label="@", type="A", value="1.2.3.4")]
+    cache = DigCache()
+
+    diff = compare_dns_state(zone, cache)
+    is_valid, _ = validate_dns_state(zone, cache)
+
+    assert not diff.has_changes()
+    assert is_valid
+    assert mock_dig.call_count == 8
+    assert cache.results[("example.com", "A")] == ["1.2.3.4"]
+
+
+@patch("tuneup_alpha.dns_state.dig_lookup")
+def test_compare_dns_state_duplicate_desired_records(mock_dig: any) -> None:
+    """Test duplicate desired records produce a single create for the last of them."""
+    mock_dig.return_value = []
+
+    zone = _zone()
+    zone.records = [
+        Record(label="@", type="A", value="1.2.3.4"),
+        Record(label="@", type="A", value="1.2.3.4", ttl=600),
+    ]
+
+    diff = compare_dns_state(zone)
+
+    assert diff.summary() == {"create": 1, "delete": 0, "update": 0}
+    assert diff.changes[0].record.ttl == 600
+
+
+def test_record_keys_do_not_collide_on_separator_in_value() -> None:
+    """Test a value containing ':' cannot alias a key with a priority."""
+    from tuneup_alpha.dns_state import _record_key_enhanced
+
+    assert _record_key_enhanced("@", "MX", "mail:p10") != _record_key_enhanced(
+        "@", "MX", "mail", priority=10
+    )
@@ -1,9 +1,19 @@
 from pathlib import Path
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from tuneup_alpha.models import AppConfig, Record, RecordChange, Zone
+from tuneup_alpha.models import (
+    RECORD_TYPES,
+    AppConfig,
+    Record,
+    RecordChange,
+    Zone,
+    validate_label,
+)
+
+_KEY_FILE = Path("/etc/key.key")
+_RECORD_LIST = TypeAdapter(list[Record])
 
 
 def test_record_defaults() -> None:
@@ -18,6 +28,14 @@ def test_record_custom_ttl() -> None:
     assert record.is_apex is False
 
 
+def test_record_is_frozen_and_hashable() -> None:
+    record = Record(label="@", type="A", value="1.2.3.4")
+    with pytest.raises(ValidationError, match="frozen"):
+        record.value = "5.6.7.8"  # type: ignore[misc]
+    assert hash(record) == hash(Record(label="@", type="A", value="1.2.3.4"))
+    assert record.model_copy(update={"value": "5.6.7.8"}).value == "5.6.7.8"
+
+
 def test_record_validation_min_ttl() -> None:
     with pytest.raises(ValidationError):
         Record(label="@", type="A", value="1.2.3.4", ttl=30)
@@ -29,7 +47,7 @@ def test_record_validation_label_required() -> None:
 
 
 def test_zone_defaults() -> None:
-    zone = Zone(name="example.com", server="ns1.example.com", key_file=Path("/etc/key.key"))
+    zone = Zone(name="example.com", server="ns1.example.com", key_file=_KEY_FILE)
     assert zone.default_ttl == 3600
     assert zone.notes is None
     assert zone.records == []
@@ -39,7 +57,7 @@ def test_zone_with_notes() -> None:
     zone = Zone(
         name="example.com",
         server="ns1.example.com",
-        key_file=Path("/etc/key.key"),
+        key_file=_KEY_FILE,
         notes="Test zone",
     )
     assert zone.notes == "Test zone"
@@ -49,7 +67,7 @@ def test_zone_with_records() -> None:
     zone = Zone(
         name="example.com",
         server="ns1.example.com",
-        key_file=Path("/etc/key.key"),
+        key_file=_KEY_FILE,
         records=[Record(label="@", type="A", value="1.2.3.4")],
     )
     assert len(zone.records) == 1
@@ -80,14 +98,20 @@ def test_record_change_delete() -> None:
     assert change.record == record
 
 
-def test_app_config_empty() -> None:
-    config = AppConfig()
-    assert config.zones == []
+@pytest.fixture(scope="module")
+def default_app_config() -> AppConfig:
+    """Return one default AppConfig shared, read-only, by the default-value tests."""
+    return AppConfig()
+
+
+def test_app_config_empty(default_app_config: AppConfig) -> None:
+    assert default_app_config.zones == []
 
 
 def test_app_config_with_zones() -> None:
-    zone = Zone(name="example.com", server="ns1.example.com", key_file=Path("/etc/key.key"))
+    zone = Zone(name="example.com", server="ns1.example.com", key_file=_KEY_FILE)
     config = AppConfig(zones=[zone])
+    assert config.zones[0] is zone
     assert len(config.zones) == 1
     assert config.zones[0].name == "example.com"
 
@@ -115,80 +139,99 @@ def test_record_action_validation() -> None:
         RecordChange(action="invalid", record=record)  # type: ignore
 
 
-def test_record_ipv4_validation() -> None:
-    # Valid IPv4 addresses
-    Record(label="@", type="A", value="1.2.3.4")
-    Record(label="@", type="A", value="192.168.1.1")
-    Record(label="@", type="A", value="255.255.255.255")
-    Record(label="@", type="A", value="0.0.0.0")
+VALID_IPV4 = ("1.2.3.4", "192.168.1.1", "255.255.255.255", "0.0.0.0")
 
-    # Invalid IPv4 addresses
-    with pytest.raises(ValidationError, match="Invalid IPv4 address"):
-        Record(label="@", type="A", value="256.1.1.1")
+INVALID_IPV4 = (
+    ("256.1.1.1", "Invalid IPv4 address"),
+    ("1.2.3", "Invalid IPv4 address"),
+    ("not.an.ip.address", "Invalid IPv4 address"),
+    ("01.02.03.04", "Invalid IPv4 address"),
+    ("1.2.3.4 ", "Invalid IPv4 address"),
+)
 
-    with pytest.raises(ValidationError, match="Invalid IPv4 address"):
-        Record(label="@", type="A", value="1.2.3")
 
-    with pytest.raises(ValidationError, match="Invalid IPv4 address"):
-        Record(label="@", type="A", value="not.an.ip.address")
+@pytest.mark.parametrize("value", VALID_IPV4)
+def test_record_ipv4_valid(value: str) -> None:
+    Record(label="@", type="A", value=value)
 
 
-def test_record_label_validation() -> None:
-    # Valid labels
-    Record(label="@", type="A", value="1.2.3.4")
-    Record(label="www", type="A", value="1.2.3.4")
-    Record(label="mail-server", type="A", value="1.2.3.4")
-    Record(label="test_record", type="A", value="1.2.3.4")
-    Record(label="api.v1", type="A", value="1.2.3.4")
-    Record(label="svc-01.edge", type="A", value="1.2.3.4")
-    Record(label="node@cluster", type="A", value="1.2.3.4")
-    Record(label="srv1", type="A", value="1.2.3.4")
-    Record(label="srv1.", type="A", value="1.2.3.4")
-    Record(label="multi.segment.", type="A", value="1.2.3.4")
-
-    # Invalid labels
-    with pytest.raises(ValidationError, match="cannot start or end with a hyphen"):
-        Record(label="-invalid", type="A", value="1.2.3.4")
+@pytest.mark.parametrize(("value", "msg"), INVALID_IPV4)
+def test_record_ipv4_invalid(value: str, msg: str) -> None:
+    with pytest.raises(ValidationError, match=msg):
+        Record.model_validate({"label": "@", "type": "A", "value": value})
 
-    with pytest.raises(ValidationError, match="cannot start or end with a hyphen"):
-        Record(label="invalid-", type="A", value="1.2.3.4")
 
-    with pytest.raises(ValidationError, match="empty segments"):
-        Record(label="invalid..label", type="A", value="1.2.3.4")
+VALID_LABELS = (
+    "@",
+    "www",
+    "mail-server",
+    "test_record",
+    "api.v1",
+    "svc-01.edge",
+    "node@cluster",
+    "srv1",
+    "srv1.",
+    "multi.segment.",
+)
 
-    # Label too long
-    with pytest.raises(ValidationError, match="exceeds maximum length"):
-        Record(label="a" * 64, type="A", value="1.2.3.4")
+INVALID_LABELS = (
+    ("-invalid", "cannot start or end with a hyphen"),
+    ("invalid-", "cannot start or end with a hyphen"),
+    ("invalid..label", "empty segments"),
+    ("a" * 64, "exceeds maximum length"),
+    (".invalid", "start with a dot"),
+    (".", "start with a dot"),
+)
 
-    with pytest.raises(ValidationError, match="start with a dot"):
-        Record(label=".invalid", type="A", value="1.2.3.4")
 
-    with pytest.raises(ValidationError, match="start with a dot"):
-        Record(label=".", type="A", value="1.2.3.4")
+@pytest.mark.parametrize("label", VALID_LABELS)
+def test_record_label_valid(label: str) -> None:
+    assert validate_label(label) == label
 
 
-def test_record_cname_validation() -> None:
-    # Valid CNAME values
-    Record(label="www", type="CNAME", value="@")
-    Record(label="www", type="CNAME", value="example.com")
-    Record(label="www", type="CNAME", value="example.com.")
-    Record(label="www", type="CNAME", value="subdomain.example.com")
-    Record(label="www", type="CNAME", value="target.example.")
+@pytest.mark.parametrize(("label", "msg"), INVALID_LABELS)
+def test_record_label_invalid(label: str, msg: str) -> None:
+    with pytest.raises(ValueError, match=msg):
+        validate_label(label)
+
+
+def test_record_label_validator_applies_to_model() -> None:
+    assert Record(label="svc-01.edge", type="A", value="1.2.3.4").label == "svc-01.edge"
+
+    with pytest.raises(ValidationError, match="cannot start or end with a hyphen"):
+        Record.model_validate({"label": "-invalid", "type": "A", "value": "1.2.3.4"})
+
+
+VALID_CNAME_TARGETS = (
+    "@",
+    "example.com",
+    "example.com.",
+    "subdomain.example.com",
+    "target.example.",
+    "s1._domainkey.example.net",
+)
+
+INVALID_CNAME_TARGETS = (
+    ("-invalid.com", "Invalid hostname"),
+    ("invalid-.com", "Invalid hostname"),
+    (".invalid.com", "Invalid hostname"),
+    ("a" * 64 + ".example.com", "Invalid hostname"),
+)
 
-    # Invalid CNAME values
-    with pytest.raises(ValidationError, match="Invalid hostname"):
-        Record(label="www", type="CNAME", value="-invalid.com")
 
-    with pytest.raises(ValidationError, match="Invalid hostname"):
-        Record(label="www", type="CNAME", value="invalid-.com")
+@pytest.mark.parametrize("value", VALID_CNAME_TARGETS)
+def test_record_cname_valid(value: str) -> None:
+    Record(label="www", type="CNAME", value=value)
 
-    with pytest.raises(ValidationError, match="Invalid hostname"):
-        Record(label="www", type="CNAME", value=".invalid.com")
 
+@pytest.mark.parametrize(("value", "msg"), INVALID_CNAME_TARGETS)
+def test_record_cname_invalid(value: str, msg: str) -> None:
+    with pytest.raises(ValidationError, match=msg):
+        Record.model_validate({"label": "www", "type": "CNAME", "value": value})
 
-def test_app_config_default_prefix_key_path() -> None:
-    config = AppConfig()
-    assert config.prefix_key_path == "~/.config/nsupdate"
+
+def test_app_config_default_prefix_key_path(default_app_config: AppConfig) -> None:
+    assert default_app_config.prefix_key_path == "~/.config/nsupdate"
 
 
 def test_app_config_custom_prefix_key_path() -> None:
@@ -197,7 +240,7 @@ def test_app_config_custom_prefix_key_path() -> None:
 
 
 def test_app_config_with_prefix_key_path_and_zones() -> None:
-    zone = Zone(name="example.com", server="ns1.example.com", key_file=Path("/etc/key.key"))
+    zone = Zone(name="example.com", server="ns1.example.com", key_file=_KEY_FILE)
     config = AppConfig(zones=[zone], prefix_key_path="/etc/nsupdate")
     assert config.prefix_key_path == "/etc/nsupdate"
     assert len(config.zones) == 1
@@ -206,20 +249,31 @@ def test_app_config_with_prefix_key_path_and_zones() -> None:
 # Tests for new record types
 
 
-def test_record_aaaa_validation() -> None:
-    # Valid IPv6 addresses
-    Record(label="@", type="AAAA", value="2001:0db8:85a3:0000:0000:8a2e:0370:7334")
-    Record(label="@", type="AAAA", value="2001:db8:85a3::8a2e:370:7334")
-    Record(label="@", type="AAAA", value="::1")
-    Record(label="@", type="AAAA", value="fe80::1")
-    Record(label="@", type="AAAA", value="::ffff:192.0.2.1")
+VALID_IPV6 = (
+    "2001:0db8:85a3:0000:0000:8a2e:0370:7334",
+    "2001:db8:85a3::8a2e:370:7334",
+    "::1",
+    "fe80::1",
+    "::ffff:192.0.2.1",
+    "fe80::1%eth0",
+)
+
+INVALID_IPV6 = (
+    ("not.an.ipv6.address", "Invalid IPv6 address"),
+    ("192.168.1.1", "Invalid IPv6 address"),
+    ("2001:db8::1::2", "Invalid IPv6 address"),
+)
+
 
-    # Invalid IPv6 addresses
-    with pytest.raises(ValidationError, match="Invalid IPv6 address"):
-        Record(label="@", type="AAAA", value="not.an.ipv6.address")
+@pytest.mark.parametrize("value", VALID_IPV6)
+def test_record_aaaa_valid(value: str) -> None:
+    Record(label="@", type="AAAA", value=value)
 
-    with pytest.raises(ValidationError, match="Invalid IPv6 address"):
-        Record(label="@", type="AAAA", value="192.168.1.1")
+
+@pytest.mark.parametrize(("value", "msg"), INVALID_IPV6)
+def test_record_aaaa_invalid(value: str, msg: str) -> None:
+    with pytest.raises(ValidationError, match=msg):
+        Record.model_validate({"label": "@", "type": "AAAA", "value": value})
 
 
 def test_record_mx_validation() -> None:
@@ -290,41 +344,54 @@ def test_record_ns_validation() -> None:
         Record(label="@", type="NS", value="-invalid.com")
 
 
-def test_record_caa_validation() -> None:
-    # Valid CAA records
-    Record(label="@", type="CAA", value="0 issue letsencrypt.org")
-    Record(label="@", type="CAA", value="0 issuewild ca.example.com")
-    Record(label="@", type="CAA", value="0 iodef mailto:security@example.com")
-    Record(label="@", type="CAA", value="128 issue ca.example.com")
+VALID_CAA = (
+    "0 issue letsencrypt.org",
+    "0 issuewild ca.example.com",
+    "0 iodef mailto:security@example.com",
+    "128 issue ca.example.com",
+)
+
+INVALID_CAA = (
+    ("0 issue", "Invalid CAA record format"),
+    ("bad issue ca.example.com", "CAA flags must be numeric"),
+    ("256 issue ca.example.com", "CAA flags must be 0-255"),
+    ("0 badtag ca.example.com", "CAA tag must be"),
+)
 
-    # Invalid CAA - wrong format
-    with pytest.raises(ValidationError, match="Invalid CAA record format"):
-        Record(label="@", type="CAA", value="0 issue")
 
-    # Invalid CAA - bad flags
-    with pytest.raises(ValidationError, match="CAA flags must be numeric"):
-        Record(label="@", type="CAA", value="bad issue ca.example.com")
+@pytest.mark.parametrize("value", VALID_CAA)
+def test_record_caa_valid(value: str) -> None:
+    Record(label="@", type="CAA", value=value)
 
-    with pytest.raises(ValidationError, match="CAA flags must be 0-255"):
-        Record(label="@", type="CAA", value="256 issue ca.example.com")
 
-    # Invalid CAA - bad tag
-    with pytest.raises(ValidationError, match="CAA tag must be"):
-        Record(label="@", type="CAA", value="0 badtag ca.example.com")
+@pytest.mark.parametrize(("value", "msg"), INVALID_CAA)
+def test_record_caa_invalid(value: str, msg: str) -> None:
+    with pytest.raises(ValidationError, match=msg):
+        Record.model_validate({"label": "@", "type": "CAA", "value": value})
 
 
 def test_record_type_validation_updated() -> None:
-    # Valid types - including new ones
-    Record(label="@", type="A", value="1.2.3.4")
-    Record(label="@", type="AAAA", value="2001:db8::1")
-    Record(label="www", type="CNAME", value="@")
-    Record(label="@", type="MX", value="mail.example.com", priority=10)
-    Record(label="@", type="TXT", value="v=spf1 ~all")
-    Record(
-        label="_http._tcp", type="SRV", value="server.example.com", priority=0, weight=0, port=80
+    # Valid types - including new ones, validated in one list pass
+    records = _RECORD_LIST.validate_python(
+        [
+            {"label": "@", "type": "A", "value": "1.2.3.4"},
+            {"label": "@", "type": "AAAA", "value": "2001:db8::1"},
+            {"label": "www", "type": "CNAME", "value": "@"},
+            {"label": "@", "type": "MX", "value": "mail.example.com", "priority": 10},
+            {"label": "@", "type": "TXT", "value": "v=spf1 ~all"},
+            {
+                "label": "_http._tcp",
+                "type": "SRV",
+                "value": "server.example.com",
+                "priority": 0,
+                "weight": 0,
+                "port": 80,
+            },
+            {"label": "@", "type": "NS", "value": "ns1.example.com"},
+            {"label": "@", "type": "CAA", "value": "0 issue ca.example.com"},
+        ]
     )
-    Record(label="@", type="NS", value="ns1.example.com")
-    Record(label="@", type="CAA", value="0 issue ca.example.com")
+    assert {record.type for record in records} == RECORD_TYPES
 
     # Invalid type should still raise validation error
     with pytest.raises(ValidationError):
@@ -1,14 +1,49 @@
 """Tests for theme persistence in TUI."""
 
 from pathlib import Path
-from unittest.mock import MagicMock
+
+import pytest
 
 from tuneup_alpha.config import ConfigRepository
 from tuneup_alpha.models import AppConfig
 from tuneup_alpha.tui import ZoneDashboard
 
 
-def test_default_theme_is_textual_dark(tmp_path: Path) -> None:
+class InMemoryConfigRepository(ConfigRepository):
+    """ConfigRepository that keeps the configuration in memory.
+
+    ``load`` and ``save`` exchange deep copies, isolating callers the way a
+    YAML round-trip would without touching the filesystem. The YAML path is
+    covered by ``test_theme_persisted_in_config``.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(Path("in-memory/config.yaml"))
+        self._config = AppConfig()
+
+    def load(self) -> AppConfig:
+        return self._config.model_copy(deep=True)
+
+    def save(self, config: AppConfig) -> None:
+        self._config = config.model_copy(deep=True)
+
+
+class _Notify:
+    """Records the arguments of each ``notify`` call in place of the real method."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple, dict]] = []
+
+    def __call__(self, *args: object, **kwargs: object) -> None:
+        self.calls.append((args, kwargs))
+
+
+@pytest.fixture
+def in_memory_repo() -> InMemoryConfigRepository:
+    return InMemoryConfigRepository()
+
+
+def test_default_theme_is_textual_dark() -> None:
     """Test that default theme is textual-dark."""
     config = AppConfig()
     assert config.theme == "textual-dark"
@@ -28,10 +63,9 @@ def test_theme_persisted_in_config(tmp_path: Path) -> None:
     assert loaded_config.theme == "nord"
 
 
-def test_theme_loaded_on_dashboard_mount(tmp_path: Path) -> None:
+def test_theme_loaded_on_dashboard_mount(in_memory_repo: InMemoryConfigRepository) -> None:
     """Test that theme is loaded from config when dashboard starts."""
-    config_path = tmp_path / "config.yaml"
-    repo = ConfigRepository(config_path)
+    repo = in_memory_repo
 
     # Save a config with a specific theme
     config = AppConfig(theme="dracula")
@@ -50,17 +84,13 @@ def test_theme_loaded_on_dashboard_mount(tmp_path: Path) -> None:
     assert dashboard.theme == "dracula"
 
 
-def test_theme_saved_on_quit(tmp_path: Path) -> None:
+def test_theme_saved_on_quit(in_memory_repo: InMemoryConfigRepository) -> None:
     """Test that theme is saved when quitting the dashboard."""
-    config_path = tmp_path / "config.yaml"
-    repo = ConfigRepository(config_path)
-
-    # Start with default config
-    repo.save(AppConfig())
+    repo = in_memory_repo
 
-    # Create dashboard
+    # Create dashboard, starting from the default config
     dashboard = ZoneDashboard(config_repo=repo)
-    dashboard._config = repo.load()
+    dashboard._config = AppConfig()
 
     # Change theme
     dashboard.theme = "gruvbox"
@@ -74,17 +104,17 @@ def test_theme_saved_on_quit(tmp_path: Path) -> None:
     assert saved_config.theme == "gruvbox"
 
 
-def test_cycle_theme_action(tmp_path: Path) -> None:
+def test_cycle_theme_action(in_memory_repo: InMemoryConfigRepository) -> None:
     """Test that cycle_theme action changes theme."""
-    config_path = tmp_path / "config.yaml"
-    repo = ConfigRepository(config_path)
+    repo = in_memory_repo
 
     # Create dashboard
     dashboard = ZoneDashboard(config_repo=repo)
     dashboard._config = repo.load()
 
     # Mock notify to prevent actual UI updates
-    dashboard.notify = MagicMock()
+    notify = _Notify()
+    dashboard.notify = notify
 
     # Get initial theme
     initial_theme = dashboard.theme
@@ -94,24 +124,23 @@ def test_cycle_theme_action(tmp_path: Path) -> None:
 
     # Verify theme changed
     assert dashboard.theme != initial_theme
-    assert dashboard.notify.called
+    assert notify.calls
 
     # Verify notification message
-    call_args = dashboard.notify.call_args
-    assert "Theme changed to:" in call_args[0][0]
+    args, _kwargs = notify.calls[-1]
+    assert "Theme changed to:" in args[0]
 
 
-def test_cycle_theme_wraps_around(tmp_path: Path) -> None:
+def test_cycle_theme_wraps_around(in_memory_repo: InMemoryConfigRepository) -> None:
     """Test that cycling theme wraps around to first theme."""
-    config_path = tmp_path / "config.yaml"
-    repo = ConfigRepository(config_path)
+    repo = in_memory_repo
 
     # Create dashboard
     dashboard = ZoneDashboard(config_repo=repo)
     dashboard._config = repo.load()
 
     # Mock notify
-    dashboard.notify = MagicMock()
+    dashboard.notify = _Notify()
 
     # Get all available themes
     themes = list(dashboard.available_themes)
@@ -125,10 +154,9 @@ def test_cycle_theme_wraps_around(tmp_path: Path) -> None:
     assert dashboard.theme == themes[0]
 
 
-def test_theme_roundtrip_persistence(tmp_path: Path) -> None:
+def test_theme_roundtrip_persistence(in_memory_repo: InMemoryConfigRepository) -> None:
     """Test complete theme persistence roundtrip."""
-    config_path = tmp_path / "config.yaml"
-    repo = ConfigRepository(config_path)
+    repo = in_memory_repo
 
     # Session 1: Set theme and save
     dashboard1 = ZoneDashboard(config_repo=repo)
@@ -150,7 +178,7 @@ def test_theme_roundtrip_persistence(tmp_path: Path) -> None:
     assert dashboard2.theme == "tokyo-night"
 
 
-def test_action_quit_is_async(tmp_path: Path) -> None:
+def test_action_quit_is_async(in_memory_repo: InMemoryConfigRepository) -> None:
     """Test that action_quit is properly defined as an async method.
 
     This is critical because the parent App.action_quit is async, and if
@@ -158,8 +186,7 @@ def test_action_quit_is_async(tmp_path: Path) -> None:
     """
     import inspect
 
-    config_path = tmp_path / "config.yaml"
-    repo = ConfigRepository(config_path)
+    repo = in_memory_repo
 
     # Create dashboard
     dashboard = ZoneDashboard(config_repo=repo)
@@ -1,21 +1,104 @@
 """Tests for TUI components, particularly form handling."""
 
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, Future
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
-from tuneup_alpha.models import Record, Zone
+import pytest
+from textual.app import App
+from textual.widgets import Input, Static
+
+from tuneup_alpha import tui_forms
+from tuneup_alpha.config import ConfigRepository
+from tuneup_alpha.models import AppConfig, Record, Zone
 from tuneup_alpha.tui import RecordFormScreen, ZoneDashboard, ZoneFormScreen
 
 
+class _MockInput:
+    """Stand-in for a Textual ``Input``: just an id and a value."""
+
+    __slots__ = ("id", "value")
+
+    def __init__(self, input_id: str, value: str = "") -> None:
+        self.id = input_id
+        self.value = value
+
+
+class _MockStatic:
+    """Stand-in for a Textual ``Static`` that remembers the last update."""
+
+    __slots__ = ("renderable",)
+
+    def __init__(self) -> None:
+        self.renderable = ""
+
+    def update(self, text: str) -> None:
+        self.renderable = text
+
+
+def _query_one(
+    widgets: dict[str, object], fallback: Callable[..., object] | None = None
+) -> Callable[..., object]:
+    """Build a ``query_one`` replacement that serves widgets by selector."""
+
+    def query_one(selector: str, input_type: object = None) -> object:
+        if selector in widgets:
+            return widgets[selector]
+        return fallback(selector, input_type) if fallback else None
+
+    return query_one
+
+
+# The forms' real DNS thread pool, kept before the fixture below replaces it
+_DNS_THREAD_POOL = tui_forms._DNS_EXECUTOR
+
+
+class _InlineExecutor(Executor):
+    """Executor that runs each submitted call right away on the calling thread."""
+
+    def __init__(self) -> None:
+        self.submitted = 0
+
+    def submit(self, fn: Callable[..., object], /, *args: object, **kwargs: object) -> Future:
+        self.submitted += 1
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+@pytest.fixture(autouse=True)
+def inline_dns_lookups(monkeypatch: pytest.MonkeyPatch) -> _InlineExecutor:
+    """Run form lookups on the test thread; most forms here have no running app."""
+    executor = _InlineExecutor()
+    monkeypatch.setattr("tuneup_alpha.tui_forms._DNS_EXECUTOR", executor)
+    return executor
+
+
+def _fake_dns_lookup(monkeypatch: pytest.MonkeyPatch, result: object = None) -> list[str]:
+    """Stub ``tui_forms.dns_lookup`` to return ``result`` and record the values it gets."""
+    calls: list[str] = []
+
+    def fake_dns_lookup(value: str) -> object:
+        calls.append(value)
+        return result
+
+    monkeypatch.setattr("tuneup_alpha.tui_forms.dns_lookup", fake_dns_lookup)
+    return calls
+
+
 def test_zone_dashboard_disables_tab_bindings() -> None:
     """Test that tab and shift+tab bindings are disabled in the main dashboard.
 
     Note: priority is False to allow modal screens to override with their own tab bindings.
     """
-    dashboard = ZoneDashboard()
-
+    # BINDINGS is a class attribute, so no dashboard instance is needed.
     # Check that tab and shift+tab bindings exist and point to noop action
-    tab_bindings = [b for b in dashboard.BINDINGS if b.key in ("tab", "shift+tab")]
+    tab_bindings = [b for b in ZoneDashboard.BINDINGS if b.key in {"tab", "shift+tab"}]
 
     assert len(tab_bindings) == 2, "Should have both tab and shift+tab bindings"
 
@@ -51,28 +134,17 @@ def test_zone_form_preserves_records_on_edit(tmp_path: Path) -> None:
     form._initial_zone = zone
     form._original_name = zone.name
 
-    # Simulate form field values (same as original)
-    class MockInput:
-        def __init__(self, value):
-            self.value = value
-
-    # Mock the query_one method to return form values
-    original_query_one = form.query_one
-
-    def mock_query_one(selector, input_type=None):
-        if selector == "#zone-name":
-            return MockInput(zone.name)
-        elif selector == "#zone-server":
-            return MockInput(zone.server)
-        elif selector == "#zone-key":
-            return MockInput(str(zone.key_file))
-        elif selector == "#zone-ttl":
-            return MockInput(str(zone.default_ttl))
-        elif selector == "#zone-notes":
-            return MockInput(zone.notes or "")
-        return original_query_one(selector, input_type)
-
-    form.query_one = mock_query_one
+    # Simulate form field values (same as original), falling back to the real widgets
+    form.query_one = _query_one(
+        {
+            "#zone-name": _MockInput("zone-name", zone.name),
+            "#zone-server": _MockInput("zone-server", zone.server),
+            "#zone-key": _MockInput("zone-key", str(zone.key_file)),
+            "#zone-ttl": _MockInput("zone-ttl", str(zone.default_ttl)),
+            "#zone-notes": _MockInput("zone-notes", zone.notes or ""),
+        },
+        fallback=form.query_one,
+    )
 
     # Build the zone
     updated_zone = form._build_zone()
@@ -82,6 +154,67 @@ def test_zone_form_preserves_records_on_edit(tmp_path: Path) -> None:
     assert updated_zone.records[0].label == "@"
     assert updated_zone.records[1].label == "www"
     assert updated_zone.records == original_records
+    # Nothing was edited, so the form hands back the original zone
+    assert updated_zone is zone
+
+
+def test_zone_form_edit_builds_new_zone_when_changed(tmp_path: Path) -> None:
+    """Changing any field builds a new zone that keeps the existing records."""
+    records = [Record(label="@", type="A", value="198.51.100.10", ttl=600)]
+    zone = Zone(
+        name="example.com",
+        server="ns1.example.com",
+        key_file=tmp_path / "example.key",
+        records=records,
+    )
+    form = ZoneFormScreen(mode="edit", zone=zone)
+    form.query_one = _query_one(
+        {
+            "#zone-name": _MockInput("zone-name", zone.name),
+            "#zone-server": _MockInput("zone-server", zone.server),
+            "#zone-key": _MockInput("zone-key", str(zone.key_file)),
+            "#zone-ttl": _MockInput("zone-ttl", str(zone.default_ttl)),
+            "#zone-notes": _MockInput("zone-notes", "Now with notes"),
+        }
+    )
+
+    updated_zone = form._build_zone()
+
+    assert updated_zone is not zone
+    assert updated_zone.notes == "Now with notes"
+    assert updated_zone.records == records
+
+
+def test_zone_dashboard_skips_save_for_unchanged_zone(tmp_path: Path) -> None:
+    """Saving an unedited zone does not rewrite the configuration."""
+    config_path = tmp_path / "config.yaml"
+    zone = Zone(name="example.com", server="ns1.example.com", key_file=tmp_path / "example.key")
+    dashboard = ZoneDashboard(config_repo=ConfigRepository(config_path))
+    dashboard._config = AppConfig(zones=[zone])
+    notices: list[str] = []
+    dashboard.notify = lambda message, **kwargs: notices.append(message)
+
+    dashboard._handle_zone_saved((zone.name, zone))
+
+    assert not config_path.exists()
+    assert notices == ["Zone 'example.com' unchanged"]
+
+
+def test_form_queries_each_input_once() -> None:
+    """Repeated reads of a field reuse the widget found by the first query."""
+    form = ZoneFormScreen(mode="add", zone=None)
+    queried: list[str] = []
+    name_input = _MockInput("zone-name", " example.com ")
+
+    def query_one(selector: str, input_type: object = None) -> object:
+        queried.append(selector)
+        return name_input
+
+    form.query_one = query_one
+
+    assert form._value("#zone-name") == "example.com"
+    assert form._value("#zone-name") == "example.com"
+    assert queried == ["#zone-name"]
 
 
 def test_zone_form_no_records_when_adding() -> None:
@@ -89,24 +222,15 @@ def test_zone_form_no_records_when_adding() -> None:
     form = ZoneFormScreen(mode="add", zone=None)
 
     # Mock query_one to return minimal valid values
-    class MockInput:
-        def __init__(self, value):
-            self.value = value
-
-    def mock_query_one(selector, input_type=None):
-        if selector == "#zone-name":
-            return MockInput("example.com")
-        elif selector == "#zone-server":
-            return MockInput("ns1.example.com")
-        elif selector == "#zone-key":
-            return MockInput("/etc/keys/example.key")
-        elif selector == "#zone-ttl":
-            return MockInput("3600")
-        elif selector == "#zone-notes":
-            return MockInput("")
-        return None
-
-    form.query_one = mock_query_one
+    form.query_one = _query_one(
+        {
+            "#zone-name": _MockInput("zone-name", "example.com"),
+            "#zone-server": _MockInput("zone-server", "ns1.example.com"),
+            "#zone-key": _MockInput("zone-key", "/etc/keys/example.key"),
+            "#zone-ttl": _MockInput("zone-ttl", "3600"),
+            "#zone-notes": _MockInput("zone-notes", ""),
+        }
+    )
 
     # Build the zone
     new_zone = form._build_zone()
@@ -115,254 +239,441 @@ def test_zone_form_no_records_when_adding() -> None:
     assert len(new_zone.records) == 0
 
 
-def test_record_form_dns_lookup_for_ip():
+def test_record_form_dns_lookup_for_ip(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that entering an IP address triggers DNS lookup and updates type."""
-    form = RecordFormScreen(mode="add", zone_name="example.com")
+    form = RecordFormScreen(mode="add", zone_name="example.com", reverse_lookup=True)
 
     # Mock query_one to return mock inputs
-    class MockInput:
-        def __init__(self, input_id):
-            self.id = input_id
-            self.value = ""
+    type_input = _MockInput("record-type")
+    info_static = _MockStatic()
 
-    type_input = MockInput("record-type")
-    info_static = type("MockStatic", (), {"update": lambda self, text: None})()
+    form.query_one = _query_one({"#record-type": type_input})
+    form._info = info_static
 
-    def mock_query_one(selector, input_type=None):
-        if selector == "#record-type":
-            return type_input
-        return None
+    calls = _fake_dns_lookup(monkeypatch, ("A", {"hostname": "example.com"}))
+
+    # Simulate user entering an IP address
+    form._perform_dns_lookup("192.0.2.1")
 
-    form.query_one = mock_query_one
+    # Assert that type was set to "A"
+    assert type_input.value == "A"
+    assert calls == ["192.0.2.1"]
+
+
+def test_record_form_skips_reverse_lookup_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without the reverse lookup option an IPv4 value sets the type without a query."""
+    form = RecordFormScreen(mode="add", zone_name="example.com")
+
+    type_input = _MockInput("record-type")
+    info_static = _MockStatic()
+
+    form.query_one = _query_one({"#record-type": type_input})
     form._info = info_static
 
-    # Mock dns_lookup to simulate successful reverse DNS
-    with patch("tuneup_alpha.tui_forms.dns_lookup") as mock_dns:
-        mock_dns.return_value = ("A", {"hostname": "example.com"})
+    calls = _fake_dns_lookup(monkeypatch, ("A", {"hostname": "example.com"}))
 
-        # Simulate user entering an IP address
-        form._perform_dns_lookup("192.0.2.1")
+    form._perform_dns_lookup("192.0.2.1")
 
-        # Assert that type was set to "A"
-        assert type_input.value == "A"
-        mock_dns.assert_called_once_with("192.0.2.1")
+    assert calls == []
+    assert type_input.value == "A"
+    assert "IPv4 address detected" in info_static.renderable
 
 
-def test_record_form_dns_lookup_for_hostname():
+def test_record_form_dns_lookup_for_hostname(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that entering a hostname triggers DNS lookup and updates type."""
     form = RecordFormScreen(mode="add", zone_name="example.com")
 
     # Mock query_one to return mock inputs
-    class MockInput:
-        def __init__(self, input_id):
-            self.id = input_id
-            self.value = ""
+    type_input = _MockInput("record-type")
+    info_static = _MockStatic()
 
-    type_input = MockInput("record-type")
-    info_static = type("MockStatic", (), {"update": lambda self, text: None})()
+    form.query_one = _query_one({"#record-type": type_input})
+    form._info = info_static
 
-    def mock_query_one(selector, input_type=None):
-        if selector == "#record-type":
-            return type_input
-        return None
+    calls = _fake_dns_lookup(monkeypatch, ("CNAME", {"ip": "192.0.2.1"}))
 
-    form.query_one = mock_query_one
-    form._info = info_static
+    # Simulate user entering a hostname
+    form._perform_dns_lookup("www.example.com")
 
-    # Mock dns_lookup to simulate successful forward DNS
-    with patch("tuneup_alpha.tui_forms.dns_lookup") as mock_dns:
-        mock_dns.return_value = ("CNAME", {"ip": "192.0.2.1"})
+    # Assert that type was set to "CNAME"
+    assert type_input.value == "CNAME"
+    assert calls == ["www.example.com"]
 
-        # Simulate user entering a hostname
-        form._perform_dns_lookup("www.example.com")
 
-        # Assert that type was set to "CNAME"
-        assert type_input.value == "CNAME"
-        mock_dns.assert_called_once_with("www.example.com")
+def test_record_form_dns_lookup_reuses_cached_answer(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Looking up the same value twice only queries the resolver once."""
+    form = RecordFormScreen(mode="add", zone_name="example.com", reverse_lookup=True)
+    form.query_one = _query_one({"#record-type": _MockInput("record-type")})
+    form._info = _MockStatic()
 
+    calls = _fake_dns_lookup(monkeypatch, ("A", {"hostname": "example.com"}))
 
-def test_record_form_dns_lookup_empty_value():
-    """Test that empty value doesn't trigger DNS lookup."""
-    form = RecordFormScreen(mode="add", zone_name="example.com")
+    form._perform_dns_lookup("192.0.2.1")
+    form._perform_dns_lookup(" 192.0.2.1 ")
+    form._perform_dns_lookup("192.0.2.2")
 
-    # Mock dns_lookup
-    with patch("tuneup_alpha.tui_forms.dns_lookup") as mock_dns:
-        # Simulate user entering empty value
-        form._perform_dns_lookup("")
+    assert calls == ["192.0.2.1", "192.0.2.2"]
 
-        # Assert that dns_lookup was not called
-        mock_dns.assert_not_called()
 
+def test_record_form_dns_lookup_refetches_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A cached answer is dropped once its TTL has passed."""
+    form = RecordFormScreen(mode="add", zone_name="example.com", reverse_lookup=True)
+    form.query_one = _query_one({"#record-type": _MockInput("record-type")})
+    form._info = _MockStatic()
 
-def test_record_form_dns_lookup_updates_type_field():
-    """Test that DNS lookup updates type field when DNS info is found.
+    calls = _fake_dns_lookup(monkeypatch, ("A", {"hostname": "example.com"}))
+    clock = [1000.0]
+    monkeypatch.setattr("tuneup_alpha.tui_forms.time.monotonic", lambda: clock[0])
 
-    This ensures consistent behavior with label lookup - both always update
-    fields when new DNS information is discovered.
-    """
-    form = RecordFormScreen(mode="add", zone_name="example.com")
+    form._perform_dns_lookup("192.0.2.1")
+    clock[0] += form._lookups.cache.ttl + 1
+    form._perform_dns_lookup("192.0.2.1")
 
-    # Mock query_one to return mock inputs
-    class MockInput:
-        def __init__(self, input_id, initial_value=""):
-            self.id = input_id
-            self.value = initial_value
+    assert calls == ["192.0.2.1", "192.0.2.1"]
 
-    # Type is already set to CNAME
-    type_input = MockInput("record-type", "CNAME")
-    info_static = type("MockStatic", (), {"update": lambda self, text: None})()
 
-    def mock_query_one(selector, input_type=None):
-        if selector == "#record-type":
-            return type_input
-        return None
+@pytest.mark.parametrize(
+    ("value", "result", "queries"),
+    [
+        ("www.example.com", ("CNAME", {"ip": None}), 2),
+        ("198.51.100.7", ("A", {"hostname": None}), 2),
+        ("www.example.com", ("CNAME", {"ip": "192.0.2.1"}), 1),
+        ("198.51.100.7", ("A", {"hostname": "host.example.com"}), 1),
+    ],
+)
+def test_record_form_dns_lookup_expires_empty_answers_sooner(
+    monkeypatch: pytest.MonkeyPatch, value: str, result: tuple[str, dict], queries: int
+) -> None:
+    """An answer that found nothing is cached for the shorter negative TTL."""
+    form = RecordFormScreen(mode="add", zone_name="example.com", reverse_lookup=True)
+    form.query_one = _query_one({"#record-type": _MockInput("record-type")})
+    form._info = _MockStatic()
 
-    form.query_one = mock_query_one
-    form._info = info_static
+    calls = _fake_dns_lookup(monkeypatch, result)
+    clock = [1000.0]
+    monkeypatch.setattr("tuneup_alpha.tui_forms.time.monotonic", lambda: clock[0])
 
-    # Mock dns_lookup to suggest "A" type
-    with patch("tuneup_alpha.tui_forms.dns_lookup") as mock_dns:
-        mock_dns.return_value = ("A", {"hostname": "example.com"})
+    form._perform_dns_lookup(value)
+    clock[0] += form._lookups.cache.negative_ttl + 1
+    assert clock[0] < 1000.0 + form._lookups.cache.ttl
+    form._perform_dns_lookup(value)
 
-        # Simulate user entering an IP address
-        form._perform_dns_lookup("192.0.2.1")
+    assert calls == [value] * queries
 
-        # Assert that type WAS changed to match the DNS lookup result
-        assert type_input.value == "A"
 
+def test_record_form_dns_lookup_runs_off_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """In a running app the resolver is called on a DNS worker thread."""
+    monkeypatch.setattr("tuneup_alpha.tui_forms._DNS_EXECUTOR", _DNS_THREAD_POOL)
+    threads: list[str] = []
 
-def test_dns_visual_cue_successful_reverse_lookup():
-    """Test visual cue for successful reverse DNS lookup."""
-    form = RecordFormScreen(mode="add", zone_name="example.com")
+    def fake_dns_lookup(value: str) -> object:
+        threads.append(threading.current_thread().name)
+        return ("CNAME", {"ip": "192.0.2.1"})
 
-    # Mock info widget to capture the displayed message
-    class MockStatic:
-        def __init__(self):
-            self.renderable = ""
+    monkeypatch.setattr("tuneup_alpha.tui_forms.dns_lookup", fake_dns_lookup)
 
-        def update(self, text):
-            self.renderable = text
+    async def scenario() -> str:
+        app: App[None] = App()
+        async with app.run_test() as pilot:
+            form = RecordFormScreen(mode="add", zone_name="example.com")
+            await app.push_screen(form)
+            type_input = form.query_one("#record-type", Input)
+
+            form._perform_dns_lookup("www.example.com")
+            for _ in range(100):
+                if type_input.value == "CNAME":
+                    break
+                await pilot.pause(0.01)
+            return type_input.value
+
+    assert asyncio.run(scenario()) == "CNAME"
+    assert len(threads) == 1
+    assert threads[0].startswith("dns")
 
-    info_static = MockStatic()
-    form._info = info_static
 
-    # Test successful reverse DNS lookup
-    form._show_lookup_info("A", {"hostname": "dns.google"})
+def test_record_form_dns_lookup_debounces_typing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Typing a value in one burst triggers a single lookup for the final text."""
+    calls = _fake_dns_lookup(monkeypatch, ("CNAME", {"ip": "192.0.2.1"}))
 
-    # Verify the visual cue includes success indicator and hostname
-    assert "✓" in info_static.renderable
-    assert "Reverse DNS: dns.google" in info_static.renderable
-    assert "[green]" in info_static.renderable
+    async def scenario() -> None:
+        app: App[None] = App()
+        async with app.run_test() as pilot:
+            form = RecordFormScreen(mode="add", zone_name="example.com")
+            await app.push_screen(form)
+            form.query_one("#record-value", Input).focus()
+
+            await pilot.press(*"www.example.com")
+            for _ in range(100):
+                if calls:
+                    break
+                await pilot.pause(0.01)
+
+    asyncio.run(scenario())
+    assert calls == ["www.example.com"]
 
 
-def test_dns_visual_cue_failed_reverse_lookup():
-    """Test visual cue for failed reverse DNS lookup."""
+def test_record_form_debounces_rapid_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Typing a label in one burst triggers a single typed lookup for the final label."""
+    calls: list[tuple[str, str, str]] = []
+
+    def fake_lookup(label: str, zone: str, record_type: str) -> str | None:
+        calls.append((label, zone, record_type))
+        return None
+
+    monkeypatch.setattr("tuneup_alpha.tui_forms.dns_lookup_label_with_type", fake_lookup)
+
+    async def scenario() -> None:
+        app: App[None] = App()
+        async with app.run_test() as pilot:
+            form = RecordFormScreen(mode="add", zone_name="example.com")
+            await app.push_screen(form)
+            form.query_one("#record-label", Input).focus()
+
+            await pilot.press(*"mail")
+            for _ in range(100):
+                if calls:
+                    break
+                await pilot.pause(0.01)
+
+    asyncio.run(scenario())
+    assert calls == [("mail", "example.com", "A")]
+
+
+def test_record_form_label_edit_and_revert_during_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Editing the label back to its value while its lookup is in flight still fills the form."""
+    monkeypatch.setattr("tuneup_alpha.tui_forms._DNS_EXECUTOR", _DNS_THREAD_POOL)
+
+    def slow_lookup(label: str, zone: str, record_type: str) -> str | None:
+        time.sleep(0.6)
+        return "1.2.3.4" if label == "www" else None
+
+    monkeypatch.setattr("tuneup_alpha.tui_forms.dns_lookup_label_with_type", slow_lookup)
+
+    async def scenario() -> tuple[str, str]:
+        app: App[None] = App()
+        async with app.run_test() as pilot:
+            form = RecordFormScreen(mode="add", zone_name="example.com")
+            await app.push_screen(form)
+            form.query_one("#record-label", Input).focus()
+            value_input = form.query_one("#record-value", Input)
+            info = form.query_one("#modal-info", Static)
+
+            await pilot.press(*"www")
+            # Let the debounced lookup for "www" start, then edit and revert the label
+            await pilot.pause(0.3)
+            await pilot.press("x", "backspace")
+            for _ in range(300):
+                if value_input.value:
+                    break
+                await pilot.pause(0.01)
+            return value_input.value, str(info.content)
+
+    value, info = asyncio.run(scenario())
+    assert value == "1.2.3.4"
+    assert "Found A record" in info
+
+
+def test_record_form_dns_lookup_failure_replaces_checking_cue(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A resolver that raises clears the checking cue instead of leaving it on screen."""
     form = RecordFormScreen(mode="add", zone_name="example.com")
+    type_input = _MockInput("record-type")
+    form.query_one = _query_one({"#record-type": type_input})
+    form._info = _MockStatic()
 
-    class MockStatic:
-        def __init__(self):
-            self.renderable = ""
+    def failing_lookup(value: str) -> object:
+        raise OSError("resolver unavailable")
 
-        def update(self, text):
-            self.renderable = text
+    monkeypatch.setattr("tuneup_alpha.tui_forms.dns_lookup", failing_lookup)
 
-    info_static = MockStatic()
-    form._info = info_static
+    form._perform_dns_lookup("www.example.com")
+
+    assert "DNS lookup failed" in form._info.renderable
+    assert type_input.value == ""
+
+
+def test_record_form_dns_lookup_failure_in_worker(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A lookup raising on a DNS worker thread reports the failure in the running form."""
+    monkeypatch.setattr("tuneup_alpha.tui_forms._DNS_EXECUTOR", _DNS_THREAD_POOL)
 
-    # Test failed reverse DNS lookup
-    form._show_lookup_info("A", {"hostname": None})
+    def failing_lookup(value: str) -> object:
+        raise OSError("resolver unavailable")
 
-    # Verify the visual cue includes no-result indicator
-    assert "○" in info_static.renderable
-    assert "No reverse DNS found" in info_static.renderable
-    assert "[yellow]" in info_static.renderable
+    monkeypatch.setattr("tuneup_alpha.tui_forms.dns_lookup", failing_lookup)
 
+    async def scenario() -> str:
+        app: App[None] = App()
+        async with app.run_test() as pilot:
+            form = RecordFormScreen(mode="add", zone_name="example.com")
+            await app.push_screen(form)
+            info = form.query_one("#modal-info", Static)
 
-def test_dns_visual_cue_successful_forward_lookup():
-    """Test visual cue for successful forward DNS lookup."""
+            form._perform_dns_lookup("www.example.com")
+            for _ in range(100):
+                if "failed" in str(info.content):
+                    break
+                await pilot.pause(0.01)
+            return str(info.content)
+
+    assert "DNS lookup failed" in asyncio.run(scenario())
+
+
+def test_record_form_dns_lookup_empty_value(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that empty value doesn't trigger DNS lookup."""
     form = RecordFormScreen(mode="add", zone_name="example.com")
 
-    class MockStatic:
-        def __init__(self):
-            self.renderable = ""
+    calls = _fake_dns_lookup(monkeypatch)
 
-        def update(self, text):
-            self.renderable = text
+    # Simulate user entering empty value
+    form._perform_dns_lookup("")
+
+    # Assert that dns_lookup was not called
+    assert calls == []
 
-    info_static = MockStatic()
-    form._info = info_static
 
-    # Test successful forward DNS lookup
-    form._show_lookup_info("CNAME", {"ip": "93.184.216.34"})
+@pytest.mark.parametrize("value", ["@", "10 mail.example.com", '0 issue "letsencrypt.org"'])
+def test_record_form_dns_lookup_skips_non_hostname_values(
+    monkeypatch: pytest.MonkeyPatch, value: str
+) -> None:
+    """Values that are neither addresses nor host names are not looked up."""
+    form = RecordFormScreen(mode="add", zone_name="example.com")
+
+    calls = _fake_dns_lookup(monkeypatch)
+
+    form._perform_dns_lookup(value)
 
-    # Verify the visual cue includes success indicator and IP
-    assert "✓" in info_static.renderable
-    assert "Forward DNS: 93.184.216.34" in info_static.renderable
-    assert "[green]" in info_static.renderable
+    assert calls == []
 
 
-def test_dns_visual_cue_failed_forward_lookup():
-    """Test visual cue for failed forward DNS lookup."""
+def test_record_form_clearing_value_drops_pending_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Clearing the value field cancels the debounced lookup instead of waiting for it."""
     form = RecordFormScreen(mode="add", zone_name="example.com")
+    form._info = _MockStatic()
+    timers: list[SimpleNamespace] = []
 
-    class MockStatic:
-        def __init__(self):
-            self.renderable = ""
+    def set_timer(delay: float, callback: Callable[[], None]) -> SimpleNamespace:
+        timer = SimpleNamespace(stopped=False)
+        timer.stop = lambda: setattr(timer, "stopped", True)
+        timers.append(timer)
+        return timer
 
-        def update(self, text):
-            self.renderable = text
+    form.set_timer = set_timer
+    calls = _fake_dns_lookup(monkeypatch)
+    value_input = _MockInput("record-value")
 
-    info_static = MockStatic()
-    form._info = info_static
+    form.on_input_changed(SimpleNamespace(input=value_input, value="www.example.com"))
+    form.on_input_changed(SimpleNamespace(input=value_input, value=""))
 
-    # Test failed forward DNS lookup
-    form._show_lookup_info("CNAME", {"ip": None})
+    assert len(timers) == 1
+    assert timers[0].stopped
+    assert calls == []
+    assert form._info.renderable == ""
 
-    # Verify the visual cue includes no-result indicator
-    assert "○" in info_static.renderable
-    assert "No forward DNS found" in info_static.renderable
-    assert "[yellow]" in info_static.renderable
 
+def test_record_form_dns_lookup_updates_type_field(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that DNS lookup updates type field when DNS info is found.
 
-def test_dns_visual_cue_checking_indicator():
-    """Test that checking indicator is shown during DNS lookup."""
-    form = RecordFormScreen(mode="add", zone_name="example.com")
+    This ensures consistent behavior with label lookup - both always update
+    fields when new DNS information is discovered.
+    """
+    form = RecordFormScreen(mode="add", zone_name="example.com", reverse_lookup=True)
 
-    class MockStatic:
-        def __init__(self):
-            self.renderable = ""
+    # Mock query_one to return mock inputs
+    # Type is already set to CNAME
+    type_input = _MockInput("record-type", "CNAME")
+    info_static = _MockStatic()
 
-        def update(self, text):
-            self.renderable = text
+    form.query_one = _query_one({"#record-type": type_input})
+    form._info = info_static
 
-    class MockInput:
-        def __init__(self, input_id):
-            self.id = input_id
-            self.value = ""
+    calls = _fake_dns_lookup(monkeypatch, ("A", {"hostname": "example.com"}))
 
-    info_static = MockStatic()
-    type_input = MockInput("record-type")
+    # Simulate user entering an IP address
+    form._perform_dns_lookup("192.0.2.1")
 
-    def mock_query_one(selector, input_type=None):
-        if selector == "#record-type":
-            return type_input
-        return None
+    # Assert that type WAS changed to match the DNS lookup result
+    assert type_input.value == "A"
+    assert calls == ["192.0.2.1"]
+
+
+@pytest.fixture(scope="module")
+def record_form() -> RecordFormScreen:
+    """Return one add-mode record form shared by the module's stateless display tests.
+
+    Tests using it must install their own ``_info`` widget and must not rely
+    on any other form state.
+    """
+    return RecordFormScreen(mode="add", zone_name="example.com")
+
+
+@pytest.mark.parametrize(
+    ("suggested_type", "lookup_result", "marker", "color", "text"),
+    [
+        pytest.param(
+            "A",
+            {"hostname": "dns.google"},
+            "✓",
+            "[green]",
+            "Reverse DNS: dns.google",
+            id="reverse-found",
+        ),
+        pytest.param(
+            "A", {"hostname": None}, "○", "[yellow]", "No reverse DNS found", id="reverse-missing"
+        ),
+        pytest.param(
+            "CNAME",
+            {"ip": "93.184.216.34"},
+            "✓",
+            "[green]",
+            "Forward DNS: 93.184.216.34",
+            id="forward-found",
+        ),
+        pytest.param(
+            "CNAME", {"ip": None}, "○", "[yellow]", "No forward DNS found", id="forward-missing"
+        ),
+        pytest.param("AAAA", {}, "✓", "[green]", "IPv6 address detected", id="ipv6"),
+    ],
+)
+def test_dns_visual_cue(
+    record_form: RecordFormScreen,
+    suggested_type: str,
+    lookup_result: dict,
+    marker: str,
+    color: str,
+    text: str,
+) -> None:
+    """Test the success and no-result cues shown after reverse and forward lookups."""
+    info_static = _MockStatic()
+    record_form._info = info_static
+
+    record_form._show_lookup_info(suggested_type, lookup_result)
+
+    assert marker in info_static.renderable
+    assert text in info_static.renderable
+    assert color in info_static.renderable
+
+
+def test_dns_visual_cue_checking_indicator(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that checking indicator is shown during DNS lookup."""
+    form = RecordFormScreen(mode="add", zone_name="example.com", reverse_lookup=True)
 
-    form.query_one = mock_query_one
+    info_static = _MockStatic()
+    type_input = _MockInput("record-type")
+
+    form.query_one = _query_one({"#record-type": type_input})
     form._info = info_static
-    form._error = MockStatic()
+    form._error = _MockStatic()
 
-    # Mock dns_lookup to verify the checking indicator appears
-    with patch("tuneup_alpha.tui_forms.dns_lookup") as mock_dns:
-        mock_dns.return_value = ("A", {"hostname": "test.com"})
+    calls = _fake_dns_lookup(monkeypatch, ("A", {"hostname": "test.com"}))
 
-        # Perform DNS lookup
-        form._perform_dns_lookup("8.8.8.8")
+    # Perform DNS lookup
+    form._perform_dns_lookup("8.8.8.8")
 
-        # The function should complete successfully
-        # Note: We can't directly test the transient "Checking DNS..." message
-        # without async testing, but we verify the function runs correctly
-        mock_dns.assert_called_once_with("8.8.8.8")
+    # The function should complete successfully
+    # Note: We can't directly test the transient "Checking DNS..." message
+    # without async testing, but we verify the function runs correctly
+    assert calls == ["8.8.8.8"]
 
 
 def test_zone_form_dynamic_lookup_on_input_change():
@@ -370,23 +681,11 @@ def test_zone_form_dynamic_lookup_on_input_change():
     form = ZoneFormScreen(mode="add", zone=None)
 
     # Mock query_one to return mock inputs
-    class MockInput:
-        def __init__(self, input_id):
-            self.id = input_id
-            self.value = ""
-
-    server_input = MockInput("zone-server")
-    key_input = MockInput("zone-key")
-    info_static = type("MockStatic", (), {"update": lambda self, text: None})()
-
-    def mock_query_one(selector, input_type=None):
-        if selector == "#zone-server":
-            return server_input
-        elif selector == "#zone-key":
-            return key_input
-        return None
+    server_input = _MockInput("zone-server")
+    key_input = _MockInput("zone-key")
+    info_static = _MockStatic()
 
-    form.query_one = mock_query_one
+    form.query_one = _query_one({"#zone-server": server_input, "#zone-key": key_input})
     form._info = info_static
     form._error = info_static
 
@@ -411,28 +710,74 @@ def test_zone_form_dynamic_lookup_on_input_change():
         assert key_input.value == ""
 
 
+def test_zone_form_lookup_queries_ns_and_a_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The NS and A lookups for a zone name are in flight at the same time."""
+    form = ZoneFormScreen(mode="add", zone=None)
+    form.query_one = _query_one(
+        {"#zone-server": _MockInput("zone-server"), "#zone-key": _MockInput("zone-key")}
+    )
+
+    # Each lookup waits for the other one to start; run back to back they would time out
+    both_started = threading.Barrier(2, timeout=5)
+
+    def fake_lookup(records: list[str]) -> Callable[[str], list[str]]:
+        def lookup(domain: str) -> list[str]:
+            both_started.wait()
+            return records
+
+        return lookup
+
+    monkeypatch.setattr(
+        "tuneup_alpha.tui_forms.lookup_nameservers", fake_lookup(["ns1.example.com"])
+    )
+    monkeypatch.setattr("tuneup_alpha.tui_forms.lookup_a_records", fake_lookup(["192.0.2.1"]))
+
+    form._perform_zone_lookup("example.com", generate_key_path=False)
+
+    assert form._discovered_ns == ["ns1.example.com"]
+    assert form._discovered_a_records == ["192.0.2.1"]
+
+
+def test_zone_form_applies_cached_answers_without_worker(
+    monkeypatch: pytest.MonkeyPatch, inline_dns_lookups: _InlineExecutor
+) -> None:
+    """Cached NS and A answers, even empty ones, are applied without a worker round trip."""
+
+    def lookup_nameservers(domain: str) -> list[str]:
+        return []
+
+    def lookup_a_records(domain: str) -> list[str]:
+        return ["192.0.2.1"]
+
+    monkeypatch.setattr("tuneup_alpha.tui_forms.lookup_nameservers", lookup_nameservers)
+    monkeypatch.setattr("tuneup_alpha.tui_forms.lookup_a_records", lookup_a_records)
+
+    form = ZoneFormScreen(mode="add", zone=None)
+    form.query_one = _query_one(
+        {"#zone-server": _MockInput("zone-server"), "#zone-key": _MockInput("zone-key")}
+    )
+    form._info = _MockStatic()
+    form._lookups.cache.get_or_call(lookup_nameservers, "example.com")
+    form._lookups.cache.get_or_call(lookup_a_records, "example.com")
+
+    form._perform_zone_lookup("example.com", generate_key_path=False)
+
+    assert form._discovered_ns == []
+    assert form._discovered_a_records == ["192.0.2.1"]
+    assert "No NS records found" in form._info.renderable
+    assert inline_dns_lookups.submitted == 0
+
+
 def test_zone_form_key_path_generated_on_blur():
     """Test that key file path is generated when zone name field loses focus."""
     form = ZoneFormScreen(mode="add", zone=None)
 
     # Mock query_one to return mock inputs
-    class MockInput:
-        def __init__(self, input_id):
-            self.id = input_id
-            self.value = ""
-
-    server_input = MockInput("zone-server")
-    key_input = MockInput("zone-key")
-    info_static = type("MockStatic", (), {"update": lambda self, text: None})()
-
-    def mock_query_one(selector, input_type=None):
-        if selector == "#zone-server":
-            return server_input
-        elif selector == "#zone-key":
-            return key_input
-        return None
+    server_input = _MockInput("zone-server")
+    key_input = _MockInput("zone-key")
+    info_static = _MockStatic()
 
-    form.query_one = mock_query_one
+    form.query_one = _query_one({"#zone-server": server_input, "#zone-key": key_input})
     form._info = info_static
     form._error = info_static
 
@@ -462,32 +807,22 @@ def test_zone_form_key_path_fallback_in_build():
     form = ZoneFormScreen(mode="add", zone=None)
 
     # Mock query_one to return mock inputs
-    class MockInput:
-        def __init__(self, input_id, value=""):
-            self.id = input_id
-            self.value = value
-
     # Setup inputs with zone name and server, but empty key path
-    zone_name_input = MockInput("zone-name", "example.com")
-    server_input = MockInput("zone-server", "ns1.example.com")
-    key_input = MockInput("zone-key", "")  # Empty key path
-    ttl_input = MockInput("zone-ttl", "3600")
-    notes_input = MockInput("zone-notes", "Test notes")
-
-    def mock_query_one(selector, input_type=None):
-        if selector == "#zone-name":
-            return zone_name_input
-        elif selector == "#zone-server":
-            return server_input
-        elif selector == "#zone-key":
-            return key_input
-        elif selector == "#zone-ttl":
-            return ttl_input
-        elif selector == "#zone-notes":
-            return notes_input
-        return None
-
-    form.query_one = mock_query_one
+    zone_name_input = _MockInput("zone-name", "example.com")
+    server_input = _MockInput("zone-server", "ns1.example.com")
+    key_input = _MockInput("zone-key", "")  # Empty key path
+    ttl_input = _MockInput("zone-ttl", "3600")
+    notes_input = _MockInput("zone-notes", "Test notes")
+
+    form.query_one = _query_one(
+        {
+            "#zone-name": zone_name_input,
+            "#zone-server": server_input,
+            "#zone-key": key_input,
+            "#zone-ttl": ttl_input,
+            "#zone-notes": notes_input,
+        }
+    )
 
     # Build the zone - this should generate the default key path as a fallback
     zone = form._build_zone()
@@ -517,84 +852,49 @@ def test_zone_form_dynamic_lookup_empty_value():
         mock_a.assert_not_called()
 
 
-def test_zone_form_key_path_not_generated_during_typing():
+def test_zone_form_key_path_not_generated_during_typing(monkeypatch: pytest.MonkeyPatch) -> None:
     """Integration test: key path should not be generated while user is typing.
 
-    This test simulates the actual flow:
-    1. User types incrementally in the zone name field (e.g., "e", "ex", "exa", etc.)
-    2. Each keystroke triggers on_input_changed
-    3. The key file path should remain empty during typing
-    4. Only when the field loses focus should the key path be generated
+    This test drives a running app:
+    1. User types the zone name one key at a time
+    2. The debounced lookup fills in the server but leaves the key path empty
+    3. Only when the field loses focus is the key path generated
     """
-    form = ZoneFormScreen(mode="add", zone=None)
-
-    # Mock query_one to return mock inputs
-    class MockInput:
-        def __init__(self, input_id):
-            self.id = input_id
-            self.value = ""
-
-    zone_name_input = MockInput("zone-name")
-    server_input = MockInput("zone-server")
-    key_input = MockInput("zone-key")
-    info_static = type("MockStatic", (), {"update": lambda self, text: None})()
-
-    def mock_query_one(selector, input_type=None):
-        if selector == "#zone-name":
-            return zone_name_input
-        elif selector == "#zone-server":
-            return server_input
-        elif selector == "#zone-key":
-            return key_input
-        return None
-
-    form.query_one = mock_query_one
-    form._info = info_static
-    form._error = info_static
-
-    # Mock the DNS lookup functions
-    with (
-        patch("tuneup_alpha.tui_forms.lookup_nameservers") as mock_ns,
-        patch("tuneup_alpha.tui_forms.lookup_a_records") as mock_a,
-    ):
-        mock_ns.return_value = ["ns1.example.com"]
-        mock_a.return_value = ["192.0.2.1"]
-
-        # Simulate user typing incrementally
-        for partial_domain in ["e", "ex", "exa", "exam", "examp", "exampl", "example"]:
-            zone_name_input.value = partial_domain
-
-            # Create a mock event with the current value
-            class MockEvent:
-                def __init__(self, val):
-                    self.input = zone_name_input
-                    self.value = val
-
-            event = MockEvent(partial_domain)
+    monkeypatch.setattr(
+        "tuneup_alpha.tui_forms.lookup_nameservers", lambda domain: ["ns1.example.com"]
+    )
+    monkeypatch.setattr("tuneup_alpha.tui_forms.lookup_a_records", lambda domain: ["192.0.2.1"])
 
-            # Simulate on_input_changed being called
-            form.on_input_changed(event)
+    async def scenario() -> None:
+        app: App[None] = App()
+        async with app.run_test() as pilot:
+            form = ZoneFormScreen(mode="add", zone=None)
+            await app.push_screen(form)
+            server_input = form.query_one("#zone-server", Input)
+            key_input = form.query_one("#zone-key", Input)
 
-            # Key path should still be empty during typing
-            assert key_input.value == "", (
-                f"Key path should be empty while typing '{partial_domain}', "
-                f"but got '{key_input.value}'"
-            )
+            # Simulate user typing incrementally, then let the debounced lookup run
+            await pilot.press(*"example.com")
+            for _ in range(100):
+                if server_input.value:
+                    break
+                await pilot.pause(0.01)
 
-        # Now simulate the zone name field losing focus
-        zone_name_input.value = "example.com"
+            assert server_input.value == "ns1.example.com"
+            # Key path should still be empty after typing
+            assert key_input.value == ""
 
-        class MockBlurEvent:
-            def __init__(self):
-                self.input = zone_name_input
+            # Now move focus off the zone name field
+            await pilot.press("tab")
+            for _ in range(100):
+                if key_input.value:
+                    break
+                await pilot.pause(0.01)
 
-        blur_event = MockBlurEvent()
-        form.on_input_blurred(blur_event)
+            # After blur, the key path should be generated
+            assert key_input.value == "~/.config/nsupdate/example.com.key"
 
-        # After blur, the key path should be generated
-        assert key_input.value == "~/.config/nsupdate/example.com.key", (
-            f"Key path should be generated on blur, but got '{key_input.value}'"
-        )
+    asyncio.run(scenario())
 
 
 def test_zone_form_dynamic_lookup_preserves_existing_server():
@@ -602,24 +902,12 @@ def test_zone_form_dynamic_lookup_preserves_existing_server():
     form = ZoneFormScreen(mode="add", zone=None)
 
     # Mock query_one to return mock inputs
-    class MockInput:
-        def __init__(self, input_id, value=""):
-            self.id = input_id
-            self.value = value
-
     # Server already has a value (user manually entered it)
-    server_input = MockInput("zone-server", "custom.nameserver.com")
-    key_input = MockInput("zone-key")
-    info_static = type("MockStatic", (), {"update": lambda self, text: None})()
-
-    def mock_query_one(selector, input_type=None):
-        if selector == "#zone-server":
-            return server_input
-        elif selector == "#zone-key":
-            return key_input
-        return None
+    server_input = _MockInput("zone-server", "custom.nameserver.com")
+    key_input = _MockInput("zone-key")
+    info_static = _MockStatic()
 
-    form.query_one = mock_query_one
+    form.query_one = _query_one({"#zone-server": server_input, "#zone-key": key_input})
     form._info = info_static
     form._error = info_static
 
@@ -643,26 +931,14 @@ def test_record_form_label_lookup_updates_fields():
     form = RecordFormScreen(mode="add", zone_name="example.com")
 
     # Mock query_one to return mock inputs
-    class MockInput:
-        def __init__(self, input_id):
-            self.id = input_id
-            self.value = ""
-
-    type_input = MockInput("record-type")
-    value_input = MockInput("record-value")
-    label_input = MockInput("record-label")
-    info_static = type("MockStatic", (), {"update": lambda self, text: None})()
-
-    def mock_query_one(selector, input_type=None):
-        if selector == "#record-type":
-            return type_input
-        elif selector == "#record-value":
-            return value_input
-        elif selector == "#record-label":
-            return label_input
-        return None
+    type_input = _MockInput("record-type")
+    value_input = _MockInput("record-value")
+    label_input = _MockInput("record-label")
+    info_static = _MockStatic()
 
-    form.query_one = mock_query_one
+    form.query_one = _query_one(
+        {"#record-type": type_input, "#record-value": value_input, "#record-label": label_input}
+    )
     form._info = info_static
     form._error = info_static
 
@@ -689,27 +965,15 @@ def test_record_form_label_lookup_overwrites_existing_values():
     form = RecordFormScreen(mode="add", zone_name="example.com")
 
     # Mock query_one to return mock inputs with existing values
-    class MockInput:
-        def __init__(self, input_id, initial_value=""):
-            self.id = input_id
-            self.value = initial_value
-
     # Fields already have values from previous lookup
-    type_input = MockInput("record-type", "A")
-    value_input = MockInput("record-value", "192.0.2.1")
-    label_input = MockInput("record-label")
-    info_static = type("MockStatic", (), {"update": lambda self, text: None})()
-
-    def mock_query_one(selector, input_type=None):
-        if selector == "#record-type":
-            return type_input
-        elif selector == "#record-value":
-            return value_input
-        elif selector == "#record-label":
-            return label_input
-        return None
+    type_input = _MockInput("record-type", "A")
+    value_input = _MockInput("record-value", "192.0.2.1")
+    label_input = _MockInput("record-label")
+    info_static = _MockStatic()
 
-    form.query_one = mock_query_one
+    form.query_one = _query_one(
+        {"#record-type": type_input, "#record-value": value_input, "#record-label": label_input}
+    )
     form._info = info_static
     form._error = info_static
 
@@ -731,26 +995,14 @@ def test_record_form_label_lookup_cname_discovered():
     form = RecordFormScreen(mode="add", zone_name="example.com")
 
     # Mock query_one to return mock inputs
-    class MockInput:
-        def __init__(self, input_id):
-            self.id = input_id
-            self.value = ""
-
-    type_input = MockInput("record-type")
-    value_input = MockInput("record-value")
-    label_input = MockInput("record-label")
-    info_static = type("MockStatic", (), {"update": lambda self, text: None})()
-
-    def mock_query_one(selector, input_type=None):
-        if selector == "#record-type":
-            return type_input
-        elif selector == "#record-value":
-            return value_input
-        elif selector == "#record-label":
-            return label_input
-        return None
+    type_input = _MockInput("record-type")
+    value_input = _MockInput("record-value")
+    label_input = _MockInput("record-label")
+    info_static = _MockStatic()
 
-    form.query_one = mock_query_one
+    form.query_one = _query_one(
+        {"#record-type": type_input, "#record-value": value_input, "#record-label": label_input}
+    )
     form._info = info_static
     form._error = info_static
 
@@ -770,25 +1022,13 @@ def test_record_form_label_lookup_empty_label():
     form = RecordFormScreen(mode="add", zone_name="example.com")
 
     # Mock query_one to return mock inputs
-    class MockInput:
-        def __init__(self, input_id):
-            self.id = input_id
-            self.value = ""
-
-    label_input = MockInput("record-label")
-    type_input = MockInput("record-type")
-    value_input = MockInput("record-value")
-
-    def mock_query_one(selector, input_type=None):
-        if selector == "#record-label":
-            return label_input
-        elif selector == "#record-type":
-            return type_input
-        elif selector == "#record-value":
-            return value_input
-        return None
+    label_input = _MockInput("record-label")
+    type_input = _MockInput("record-type")
+    value_input = _MockInput("record-value")
 
-    form.query_one = mock_query_one
+    form.query_one = _query_one(
+        {"#record-label": label_input, "#record-type": type_input, "#record-value": value_input}
+    )
 
     # Mock dns_lookup_label
     with patch("tuneup_alpha.tui_forms.dns_lookup_label") as mock_lookup:
@@ -799,40 +1039,64 @@ def test_record_form_label_lookup_empty_label():
         mock_lookup.assert_not_called()
 
 
+def test_record_form_label_lookup_skips_invalid_label():
+    """A label DNS cannot contain doesn't trigger DNS lookup."""
+    form = RecordFormScreen(mode="add", zone_name="example.com")
+
+    form.query_one = _query_one(
+        {"#record-label": _MockInput("record-label"), "#record-type": _MockInput("record-type")}
+    )
+
+    with patch("tuneup_alpha.tui_forms.dns_lookup_label") as mock_lookup:
+        form._perform_label_type_lookup("bad label", None)
+
+        mock_lookup.assert_not_called()
+    assert form._last_lookup_label is None
+
+
+def test_record_form_label_lookup_skips_unchanged_label_and_type():
+    """Repeating the last label and type neither queries again nor clears the result."""
+    form = RecordFormScreen(mode="add", zone_name="example.com")
+
+    value_input = _MockInput("record-value")
+    info_static = _MockStatic()
+
+    form.query_one = _query_one(
+        {
+            "#record-label": _MockInput("record-label", "www"),
+            "#record-type": _MockInput("record-type", "A"),
+            "#record-value": value_input,
+        }
+    )
+    form._info = info_static
+
+    with patch("tuneup_alpha.tui_forms.dns_lookup_label_with_type") as mock_lookup:
+        mock_lookup.return_value = "192.0.2.1"
+
+        form._perform_label_type_lookup("www", None)
+        form._perform_label_type_lookup("www ", None)
+        form._perform_label_type_lookup(None, "a")
+
+        assert mock_lookup.call_count == 1
+    assert value_input.value == "192.0.2.1"
+    assert "Found A record" in info_static.renderable
+
+
 def test_record_form_label_lookup_no_dns_record_found():
     """Test that label lookup clears discovered CNAME and shows appropriate message when no DNS record found."""
     form = RecordFormScreen(mode="add", zone_name="example.com")
 
     # Mock query_one to return mock inputs
-    class MockInput:
-        def __init__(self, input_id):
-            self.id = input_id
-            self.value = ""
-
-    class MockStatic:
-        def __init__(self):
-            self.renderable = ""
-
-        def update(self, text):
-            self.renderable = text
-
-    label_input = MockInput("record-label")
-    type_input = MockInput("record-type")
-    value_input = MockInput("record-value")
-    info_static = MockStatic()
-
-    def mock_query_one(selector, input_type=None):
-        if selector == "#record-label":
-            return label_input
-        elif selector == "#record-type":
-            return type_input
-        elif selector == "#record-value":
-            return value_input
-        return None
+    label_input = _MockInput("record-label")
+    type_input = _MockInput("record-type")
+    value_input = _MockInput("record-value")
+    info_static = _MockStatic()
 
-    form.query_one = mock_query_one
+    form.query_one = _query_one(
+        {"#record-label": label_input, "#record-type": type_input, "#record-value": value_input}
+    )
     form._info = info_static
-    form._error = MockStatic()
+    form._error = _MockStatic()
 
     # Set initial discovered_cname_target
     form._discovered_cname_target = "old.example.com"
@@ -856,26 +1120,14 @@ def test_record_form_type_change_triggers_lookup():
     form = RecordFormScreen(mode="add", zone_name="example.com")
 
     # Mock query_one to return mock inputs
-    class MockInput:
-        def __init__(self, input_id, initial_value=""):
-            self.id = input_id
-            self.value = initial_value
-
-    label_input = MockInput("record-label", "www")
-    type_input = MockInput("record-type", "A")
-    value_input = MockInput("record-value", "192.0.2.1")
-    info_static = type("MockStatic", (), {"update": lambda self, text: None})()
-
-    def mock_query_one(selector, input_type=None):
-        if selector == "#record-label":
-            return label_input
-        elif selector == "#record-type":
-            return type_input
-        elif selector == "#record-value":
-            return value_input
-        return None
+    label_input = _MockInput("record-label", "www")
+    type_input = _MockInput("record-type", "A")
+    value_input = _MockInput("record-value", "192.0.2.1")
+    info_static = _MockStatic()
 
-    form.query_one = mock_query_one
+    form.query_one = _query_one(
+        {"#record-label": label_input, "#record-type": type_input, "#record-value": value_input}
+    )
     form._info = info_static
     form._error = info_static
 
@@ -901,26 +1153,14 @@ def test_record_form_label_and_type_change_together():
     form = RecordFormScreen(mode="add", zone_name="example.com")
 
     # Mock query_one to return mock inputs
-    class MockInput:
-        def __init__(self, input_id, initial_value=""):
-            self.id = input_id
-            self.value = initial_value
-
-    label_input = MockInput("record-label", "mail")
-    type_input = MockInput("record-type", "MX")
-    value_input = MockInput("record-value", "")
-    info_static = type("MockStatic", (), {"update": lambda self, text: None})()
-
-    def mock_query_one(selector, input_type=None):
-        if selector == "#record-label":
-            return label_input
-        elif selector == "#record-type":
-            return type_input
-        elif selector == "#record-value":
-            return value_input
-        return None
+    label_input = _MockInput("record-label", "mail")
+    type_input = _MockInput("record-type", "MX")
+    value_input = _MockInput("record-value", "")
+    info_static = _MockStatic()
 
-    form.query_one = mock_query_one
+    form.query_one = _query_one(
+        {"#record-label": label_input, "#record-type": type_input, "#record-value": value_input}
+    )
     form._info = info_static
     form._error = info_static
 
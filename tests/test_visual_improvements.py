@@ -2,10 +2,45 @@
 
 from pathlib import Path
 
+import pytest
+
 from tuneup_alpha.config import ConfigRepository
 from tuneup_alpha.models import AppConfig, Record, Zone
 from tuneup_alpha.tui import ZoneDashboard
 
+CSS_PATH = Path(__file__).parent.parent / "src" / "tuneup_alpha" / "tui.tcss"
+
+
+@pytest.fixture(scope="module")
+def css_content() -> str:
+    """The dashboard stylesheet, read once for all CSS assertions."""
+    return CSS_PATH.read_text()
+
+
+@pytest.fixture(scope="module")
+def saved_config(tmp_path_factory: pytest.TempPathFactory) -> tuple[ConfigRepository, AppConfig]:
+    """Save a one-zone configuration once and share it across the dashboard tests.
+
+    Tests build their own ``ZoneDashboard`` on top of it and must not save
+    through the shared repository.
+    """
+    tmp_path = tmp_path_factory.mktemp("dashboard")
+    zone = Zone(
+        name="hmlab.cloud",
+        server="ns1.hmlab.cloud",
+        key_file=tmp_path / "hmlab.cloud.key",
+        notes="Test zone",
+        default_ttl=3600,
+        records=[
+            Record(label="@", type="A", value="198.51.100.10", ttl=600),
+            Record(label="www", type="CNAME", value="@", ttl=300),
+        ],
+    )
+    config = AppConfig(zones=[zone])
+    config_repo = ConfigRepository(path=tmp_path / "config.yaml")
+    config_repo.save(config)
+    return config_repo, config
+
 
 def test_app_title_is_dns_zone_dashboard() -> None:
     """Test that the app title is 'DNS Zone Dashboard'."""
@@ -13,59 +48,32 @@ def test_app_title_is_dns_zone_dashboard() -> None:
     assert app.TITLE == "DNS Zone Dashboard"
 
 
-def test_zone_panel_height_is_seven() -> None:
+def test_zone_panel_height_is_seven(css_content: str) -> None:
     """Test that the zone panel height is 7 (5 zone lines + heading + frame)."""
-    # Read the CSS file to verify the height
-    css_path = Path(__file__).parent.parent / "src" / "tuneup_alpha" / "tui.tcss"
-    css_content = css_path.read_text()
-
     # Find the #zones-table height setting
     assert "#zones-table {" in css_content
     assert "height: 7;" in css_content
 
 
-def test_panels_have_same_default_border_color() -> None:
+def test_panels_have_same_default_border_color(css_content: str) -> None:
     """Test that all panels use the same border color by default."""
-    css_path = Path(__file__).parent.parent / "src" / "tuneup_alpha" / "tui.tcss"
-    css_content = css_path.read_text()
-
     # All panels should use $panel border by default
     assert "border: solid $panel;" in css_content
 
 
-def test_focused_panel_has_distinct_border_color() -> None:
+def test_focused_panel_has_distinct_border_color(css_content: str) -> None:
     """Test that focused panels have a distinct border color."""
-    css_path = Path(__file__).parent.parent / "src" / "tuneup_alpha" / "tui.tcss"
-    css_content = css_path.read_text()
-
     # Both zones and records tables should have focused state with $primary border
     assert "#zones-table.focused {" in css_content
     assert "#records-table.focused {" in css_content
     assert "border: solid $primary;" in css_content
 
 
-def test_title_updates_when_records_panel_focused(tmp_path: Path) -> None:
+def test_title_updates_when_records_panel_focused(
+    saved_config: tuple[ConfigRepository, AppConfig],
+) -> None:
     """Test that the title includes the zone name when records panel has focus."""
-    # Create a test zone
-    zone = Zone(
-        name="hmlab.cloud",
-        server="ns1.hmlab.cloud",
-        key_file=tmp_path / "hmlab.cloud.key",
-        notes="Test zone",
-        default_ttl=3600,
-        records=[
-            Record(label="@", type="A", value="198.51.100.10", ttl=600),
-            Record(label="www", type="CNAME", value="@", ttl=300),
-        ],
-    )
-
-    # Create a config with the zone
-    config = AppConfig(zones=[zone])
-
-    # Save config to temp file
-    config_path = tmp_path / "config.yaml"
-    config_repo = ConfigRepository(path=config_path)
-    config_repo.save(config)
+    config_repo, config = saved_config
 
     # Create dashboard with the config
     app = ZoneDashboard(config_repo=config_repo)
@@ -114,23 +122,9 @@ def test_title_updates_when_records_panel_focused(tmp_path: Path) -> None:
     assert app.title == "DNS Zone Dashboard"
 
 
-def test_focus_state_updates_css_classes(tmp_path: Path) -> None:
+def test_focus_state_updates_css_classes(saved_config: tuple[ConfigRepository, AppConfig]) -> None:
     """Test that focus state updates CSS classes correctly."""
-    # Create a test zone
-    zone = Zone(
-        name="example.com",
-        server="ns1.example.com",
-        key_file=tmp_path / "example.key",
-        notes="Test zone",
-        default_ttl=3600,
-        records=[Record(label="@", type="A", value="203.0.113.10", ttl=600)],
-    )
-
-    # Create a config with the zone
-    config = AppConfig(zones=[zone])
-    config_path = tmp_path / "config.yaml"
-    config_repo = ConfigRepository(path=config_path)
-    config_repo.save(config)
+    config_repo, config = saved_config
 
     # Create dashboard with the config
     app = ZoneDashboard(config_repo=config_repo)